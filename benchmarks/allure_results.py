@@ -0,0 +1,85 @@
+"""
+Generate a synthetic allure results directory (result files shaped like the ones of this framework, attachments
+and .txt logs) and time the offline customization CLI on it, with one process and with a pool,
+then again on the processed directory where every file is skipped.
+
+    python -m benchmarks.allure_results --results 20000 --workers 8
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+
+from src.utils import allure_cli
+
+
+def build_result(index: int) -> dict:
+    start = 1_700_000_000_000 + index * 10_000
+    steps = []
+    for step_index in range(random.randint(2, 6)):
+        verifies = [
+            dict(name=f"Verify check {verify_index}", status="passed", start=start, stop=start)
+            for verify_index in range(random.randint(0, 4))
+        ]
+        steps.append(
+            dict(name=f"Step {step_index + 1}: action", status="passed", steps=verifies, start=start, stop=start)
+        )
+
+    return dict(
+        uuid=uuid.uuid4().hex, historyId=uuid.uuid4().hex, testCaseId=uuid.uuid4().hex,
+        name=f"test_case_{index}", fullName=f"tests.web.trade.test_TRD_TC{index:05d}#test_case_{index}",
+        status=random.choice(["passed", "passed", "passed", "failed", "broken"]),
+        statusDetails=dict(message="assertion failed", trace="Traceback (most recent call last):\n" * 20),
+        steps=steps,
+        attachments=[
+            dict(name="screenshot", source=f"{uuid.uuid4()}-attachment.jpg", type="image/jpg"),
+            dict(name="Screen Recording", source=f"{uuid.uuid4()}-attachment.html", type="text/html"),
+            dict(name="log", source=f"{uuid.uuid4()}-attachment.txt", type="text/plain"),
+        ],
+        parameters=[dict(name="server", value="'mt4'"), dict(name="account", value="'demo'")],
+        labels=[dict(name="suite", value="Demo"), dict(name="host", value="runner")],
+        start=start, stop=start + 5000,
+    )
+
+
+def generate(results_dir: Path, count: int, logs: int):
+    results_dir.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        result = build_result(index)
+        (results_dir / f"{result['uuid']}-result.json").write_text(json.dumps(result, indent=4), encoding="utf-8")
+
+    for index in range(logs):
+        (results_dir / f"{uuid.uuid4()}-attachment.txt").write_text("log line\n" * 50)
+
+
+def report(label: str, stats: dict):
+    print(
+        f"{label:<22} {stats['seconds']:7.2f}s {stats['files_per_second']:9.1f} files/s "
+        f"{stats['mb_per_second']:7.2f} MB/s  "
+        f"processed {stats['processed']}, skipped {stats['skipped']}, failed {stats['failed']}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Allure results CLI benchmark")
+    parser.add_argument("--results", type=int, default=5000, help="Result files to generate")
+    parser.add_argument("--logs", type=int, default=500, help=".txt log files to generate")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = Path(tmp_dir) / "source"
+        generate(source, args.results, args.logs)
+        print(f"{args.results} results, {args.logs} logs, codec {'orjson' if allure_cli.orjson else 'json'}")
+
+        for label, workers in (("1 process", 1), (f"{args.workers} processes", args.workers)):
+            target = Path(tmp_dir) / label.replace(" ", "_")
+            shutil.copytree(source, target)
+            report(label, allure_cli.run(target, workers))
+
+        report("rerun (all skipped)", allure_cli.run(target, args.workers))
@@ -0,0 +1,108 @@
+"""
+Exercise the device scheduler against fake Appium servers: worker processes lease devices,
+open a session with the allocated ports and run simulated tests, then report assignments and throughput.
+
+    python -m benchmarks.device_sharding --devices 3 --workers 3 --tests 30 --duration 0.2
+"""
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from benchmarks.fake_appium import FakeAppiumServer
+from src.core.driver.device_scheduler import DeviceScheduler
+from src.utils import DotDict
+
+
+def _post(url, payload) -> dict:
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode(), headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return json.loads(response.read())["value"]
+
+
+def _worker(lease_dir, devices, tests, duration, results):
+    DeviceScheduler.lease_dir = Path(lease_dir)
+    device = DeviceScheduler.acquire(devices, timeout=30)
+
+    caps = {
+        "appium:udid": device.udid,
+        "appium:systemPort": device.system_port,
+        "appium:mjpegServerPort": device.mjpeg_server_port,
+    }
+    session = _post(f"http://127.0.0.1:{device.appium_port}/wd/hub/session", dict(capabilities=dict(alwaysMatch=caps)))
+
+    done = 0
+    while True:
+        with tests.get_lock():
+            if tests.value <= 0:
+                break
+            tests.value -= 1
+
+        time.sleep(duration)  # simulated test on the leased device
+        done += 1
+
+    results.put(dict(device, session=session["sessionId"], tests=done))
+    DeviceScheduler.release()
+
+
+def run(device_count, worker_count, test_count, duration) -> dict:
+    devices = [DotDict(udid=f"emulator-{5554 + 2 * index}") for index in range(device_count)]
+
+    # fake appium servers listen on the ports the allocator hands out
+    servers = [FakeAppiumServer(port=0).start() for _ in devices]
+    for device, server in zip(devices, servers):
+        device.appium_port = server.port
+
+    tests = multiprocessing.Value("i", test_count)
+    results = multiprocessing.Queue()
+
+    with tempfile.TemporaryDirectory() as lease_dir:
+        start = time.perf_counter()
+        workers = [
+            multiprocessing.Process(target=_worker, args=(lease_dir, devices, tests, duration, results))
+            for _ in range(worker_count)
+        ]
+        for worker in workers:
+            worker.start()
+
+        assignments = [results.get(timeout=60 + test_count * duration) for _ in workers]
+        for worker in workers:
+            worker.join()
+
+        elapsed = time.perf_counter() - start
+
+    for server in servers:
+        server.stop()
+
+    for key in ("udid", "appium_port", "system_port", "mjpeg_server_port"):
+        values = [assignment[key] for assignment in assignments]
+        assert len(values) == len(set(values)), f"{key} shared between workers: {values}"
+
+    return dict(assignments=assignments, elapsed=elapsed, throughput=test_count / elapsed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Android device sharding benchmark")
+    parser.add_argument("--devices", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None, help="Default to one worker per device")
+    parser.add_argument("--tests", type=int, default=30)
+    parser.add_argument("--duration", type=float, default=0.2, help="Seconds per simulated test")
+    args = parser.parse_args()
+
+    baseline = run(1, 1, args.tests, args.duration)
+    sharded = run(args.devices, min(args.workers or args.devices, args.devices), args.tests, args.duration)
+
+    for assignment in sharded["assignments"]:
+        print(
+            f"{assignment['udid']}: appium={assignment['appium_port']} system={assignment['system_port']} "
+            f"mjpeg={assignment['mjpeg_server_port']} tests={assignment['tests']}"
+        )
+
+    print(f"1 device : {baseline['elapsed']:.2f}s ({baseline['throughput']:.1f} tests/s)")
+    print(f"{args.devices} devices: {sharded['elapsed']:.2f}s ({sharded['throughput']:.1f} tests/s)")
+    print(f"speedup  : x{sharded['throughput'] / baseline['throughput']:.2f}")
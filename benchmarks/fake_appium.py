@@ -0,0 +1,200 @@
+"""
+Minimal stand-in for an Appium server, enough to exercise the driver plumbing without devices:
+answers /status, creates and deletes sessions (echoing the requested capabilities), and finds elements
+of a UI hierarchy (UiAutomator2 page source XML) by xpath, id, accessibility id or UiSelector.
+
+Element lookups follow the UiAutomator2 cost model: an xpath (and the page source) needs a dump of the whole
+hierarchy, `dump_cost` per node, a UiSelector is matched while walking the nodes, `visit_cost` per node.
+
+    python -m benchmarks.fake_appium --port 4723
+"""
+import argparse
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from lxml import etree
+
+BASE_PATH = "/wd/hub"
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+EMPTY_HIERARCHY = "<hierarchy rotation='0'/>"
+
+# UiSelector method -> (page source attribute, match)
+_UI_SELECTOR_METHODS = {
+    "resourceId": ("resource-id", lambda actual, expected: actual == expected),
+    "text": ("text", lambda actual, expected: actual == expected),
+    "description": ("content-desc", lambda actual, expected: actual == expected),
+    "className": ("class", lambda actual, expected: actual == expected),
+    "textContains": ("text", lambda actual, expected: expected in actual),
+    "descriptionContains": ("content-desc", lambda actual, expected: expected in actual),
+    "textStartsWith": ("text", lambda actual, expected: actual.startswith(expected)),
+    "descriptionStartsWith": ("content-desc", lambda actual, expected: actual.startswith(expected)),
+}
+_UI_SELECTOR_CALL = re.compile(r'\.(\w+)\("((?:[^"\\]|\\.)*)"\)')
+
+
+class FakeAppiumServer:
+
+    def __init__(
+            self, port=0, host="127.0.0.1", latency=0.0, hierarchy=EMPTY_HIERARCHY, dump_cost=0.0, visit_cost=0.0
+    ):
+        self.latency = latency
+        self.dump_cost = dump_cost
+        self.visit_cost = visit_cost
+        self.sessions = {}  # session id -> capabilities
+        self.commands = {}  # command name -> count
+        self.root = etree.fromstring(hierarchy.encode("utf-8"))
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._httpd.server_address[0]}:{self.port}{BASE_PATH}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def find(self, using: str, value: str) -> list:
+        """Nodes matching the locator, paying the lookup cost of the strategy."""
+        if using == "xpath":
+            # UiAutomator2 serializes the whole hierarchy before evaluating an xpath
+            source = etree.tostring(self.root)
+            self._pay(sum(1 for _ in self.root.iter()) * self.dump_cost)
+            return [node for node in etree.fromstring(source).xpath(value) if isinstance(node, etree._Element)]
+
+        if using == "-android uiautomator":
+            conditions = [
+                (*_UI_SELECTOR_METHODS[method], re.sub(r"\\(.)", r"\1", argument))
+                for method, argument in _UI_SELECTOR_CALL.findall(value)
+            ]
+        elif using == "id":
+            conditions = [("resource-id", lambda actual, expected: actual == expected, value)]
+        elif using == "accessibility id":
+            conditions = [("content-desc", lambda actual, expected: actual == expected, value)]
+        else:
+            raise ValueError(f"Unsupported locator strategy {using!r}")
+
+        matches, visited = [], 0
+        for node in self.root.iter():
+            visited += 1
+            if all(match(node.get(attribute, ""), expected) for attribute, match, expected in conditions):
+                matches.append(node)
+
+        self._pay(visited * self.visit_cost)
+        return matches
+
+    @staticmethod
+    def _pay(seconds: float):
+        if seconds:
+            time.sleep(seconds)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def log_message(self, *_):
+                pass
+
+            def _reply(self, value, status=200):
+                body = json.dumps(dict(value=value)).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _payload(self) -> dict:
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def _route(self):
+                if server.latency:
+                    time.sleep(server.latency)
+
+                return self.path.removeprefix(BASE_PATH).strip("/").split("/")
+
+            def do_GET(self):
+                parts = self._route()
+                if parts == ["status"]:
+                    return self._reply(dict(ready=True, message="fake appium"))
+
+                if len(parts) == 3 and parts[0] == "session" and parts[2] == "source":
+                    server._pay(sum(1 for _ in server.root.iter()) * server.dump_cost)
+                    return self._reply(etree.tostring(server.root, encoding="unicode"))
+
+                self._reply(dict(error="unknown command", message=self.path), 404)
+
+            def do_POST(self):
+                parts = self._route()
+                payload = self._payload()
+                if parts == ["session"]:
+                    caps = payload.get("capabilities", {}).get("alwaysMatch", {})
+                    session_id = uuid.uuid4().hex
+                    server.sessions[session_id] = caps
+                    return self._reply(dict(sessionId=session_id, capabilities=caps))
+
+                if len(parts) == 3 and parts[0] == "session" and parts[2] in ("element", "elements"):
+                    server.commands[parts[2]] = server.commands.get(parts[2], 0) + 1
+                    try:
+                        nodes = server.find(payload["using"], payload["value"])
+
+                    except (ValueError, KeyError, etree.XPathError) as e:
+                        return self._reply(dict(error="invalid selector", message=str(e)), 400)
+
+                    elements = [{ELEMENT_KEY: uuid.uuid4().hex} for _ in nodes]
+                    if parts[2] == "elements":
+                        return self._reply(elements)
+
+                    if not elements:
+                        return self._reply(dict(error="no such element", message=payload["value"]), 404)
+
+                    return self._reply(elements[0])
+
+                self._reply(dict(error="unknown command", message=self.path), 404)
+
+            def do_DELETE(self):
+                parts = self._route()
+                if len(parts) == 2 and parts[0] == "session":
+                    server.sessions.pop(parts[1], None)
+                    return self._reply(None)
+
+                self._reply(dict(error="unknown command", message=self.path), 404)
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a fake Appium server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4723)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    args = parser.parse_args()
+
+    with FakeAppiumServer(args.port, args.host, args.latency) as fake:
+        print(f"Fake appium listening on {fake.url}")
+        try:
+            while True:
+                time.sleep(1)
+
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,115 @@
+"""
+Compare Android locators as written in the page objects (XPath) with their compiled form (UiSelector)
+against the fake Appium endpoint, over a synthetic UI hierarchy holding every resource-id they use.
+
+    python -m benchmarks.locator_compiler --nodes 1500 --dump-cost 0.00002 --visit-cost 0.000002 --repeat 5
+
+Both forms must find the same number of elements, the timings depend on the device cost given to the fake endpoint.
+"""
+import argparse
+import importlib
+import pkgutil
+import re
+import statistics
+import time
+
+from appium import webdriver
+from appium.options.android import UiAutomator2Options
+from appium.webdriver.common.appiumby import AppiumBy
+
+import src.page_object.android as android_pages
+from benchmarks.fake_appium import FakeAppiumServer
+from src.core.actions.locator_compiler import compile_locator
+
+SAMPLE_VALUE = "65"
+
+
+def collect_locators() -> list[tuple[str, str]]:
+    """XPath locators declared on the Android page objects, templates cooked with a sample value."""
+    locators = set()
+
+    for module_info in pkgutil.walk_packages(android_pages.__path__, f"{android_pages.__name__}."):
+        module = importlib.import_module(module_info.name)
+        for cls in vars(module).values():
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+
+            for value in vars(cls).values():
+                if isinstance(value, tuple) and len(value) == 2 and value[0] == AppiumBy.XPATH:
+                    locators.add((value[0], value[1].replace("{}", SAMPLE_VALUE)))
+
+    return sorted(locators)
+
+
+def build_hierarchy(locators, node_count: int) -> str:
+    """Page source with one node per resource-id used by the locators, padded with filler nodes."""
+    resource_ids = sorted({rid for _, xpath in locators for rid in re.findall(r"@resource-id='([^']*)'", xpath)})
+    nodes = [
+        f'<android.view.ViewGroup resource-id="{rid}" text="{SAMPLE_VALUE}" '
+        f'content-desc="(+{SAMPLE_VALUE}) {SAMPLE_VALUE}" class="android.view.ViewGroup" displayed="true"/>'
+        for rid in resource_ids
+    ]
+    nodes += [
+        f'<android.widget.TextView resource-id="filler-{index}" text="filler" '
+        f'class="android.widget.TextView" displayed="true"/>'
+        for index in range(max(node_count - len(nodes), 0))
+    ]
+
+    # fillers first, matches sit at the bottom of the screen as in a real scrolled view
+    nodes.reverse()
+    return f'<hierarchy rotation="0"><android.widget.FrameLayout>{"".join(nodes)}</android.widget.FrameLayout></hierarchy>'
+
+
+def measure(driver, locator, repeat: int) -> tuple[float, int]:
+    durations, found = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = len(driver.find_elements(*locator))
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations), found
+
+
+def run(node_count: int, dump_cost: float, visit_cost: float, repeat: int) -> dict:
+    locators = collect_locators()
+    compiled = {locator: compile_locator(locator) for locator in locators}
+
+    hierarchy = build_hierarchy(locators, node_count)
+    with FakeAppiumServer(hierarchy=hierarchy, dump_cost=dump_cost, visit_cost=visit_cost) as server:
+        driver = webdriver.Remote(server.url, options=UiAutomator2Options())
+        try:
+            rows = []
+            for locator in locators:
+                if compiled[locator] == locator:
+                    continue
+
+                xpath_time, xpath_found = measure(driver, locator, repeat)
+                compiled_time, compiled_found = measure(driver, compiled[locator], repeat)
+                assert xpath_found == compiled_found, f"{locator} finds {xpath_found}, compiled {compiled_found}"
+                rows.append((locator[1], xpath_time, compiled_time))
+
+        finally:
+            driver.quit()
+
+    return dict(total=len(locators), rows=rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Android locator compiler benchmark")
+    parser.add_argument("--nodes", type=int, default=1500, help="Nodes of the synthetic UI hierarchy")
+    parser.add_argument("--dump-cost", type=float, default=0.00002, help="Seconds to dump one node (xpath)")
+    parser.add_argument("--visit-cost", type=float, default=0.000002, help="Seconds to match one node (UiSelector)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    result = run(args.nodes, args.dump_cost, args.visit_cost, args.repeat)
+    rows = result["rows"]
+
+    for xpath, xpath_time, compiled_time in rows:
+        print(f"{xpath_time * 1000:8.1f}ms -> {compiled_time * 1000:8.1f}ms  {xpath}")
+
+    xpath_total = sum(row[1] for row in rows)
+    compiled_total = sum(row[2] for row in rows)
+    print(f"compiled {len(rows)}/{result['total']} locators, the others stay XPath")
+    print(f"xpath   : {xpath_total * 1000:.1f}ms")
+    print(f"compiled: {compiled_total * 1000:.1f}ms (x{xpath_total / compiled_total:.2f})")
@@ -0,0 +1,114 @@
+"""
+Classify every locator of the web page objects by how WebActions resolves it (native, rewritten to CSS,
+CSS plus an in-page text filter, or still XPath) and measure lookup timings of both forms in a browser,
+on a local HTML fixture holding an element for each data-testid the locators use.
+
+    python -m benchmarks.web_locators                 # classification and timings (needs Chrome)
+    python -m benchmarks.web_locators --no-timings    # classification only
+"""
+import argparse
+import importlib
+import pkgutil
+import re
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+import src.page_object.web as web_pages
+from src.core.actions import scripts
+from src.core.actions.locator_compiler import classify_web_locator
+
+SAMPLE_VALUE = "Sample"
+
+# arguments: locators (original, compiled), iterations -> [[original us, compiled us, original count, compiled count]]
+MEASURE_LOOKUPS = scripts.FIND_ELEMENTS + """
+const [pairs, iterations] = arguments;
+const time = (by, value) => {
+    const start = performance.now();
+    let count = 0;
+    for (let i = 0; i < iterations; i++) count = findAll(by, value).length;
+    return [(performance.now() - start) * 1000 / iterations, count];
+};
+return pairs.map(([original, compiled]) => {
+    const [originalTime, originalCount] = time(...original);
+    const [compiledTime, compiledCount] = time(...compiled);
+    return [originalTime, compiledTime, originalCount, compiledCount];
+});
+"""
+
+
+def collect_locators() -> list[tuple[str, str]]:
+    """Locators declared on the web page objects, templates cooked with a sample value."""
+    locators = set()
+
+    for module_info in pkgutil.walk_packages(web_pages.__path__, f"{web_pages.__name__}."):
+        module = importlib.import_module(module_info.name)
+        for cls in vars(module).values():
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+
+            for value in vars(cls).values():
+                if isinstance(value, tuple) and len(value) == 2 and all(isinstance(item, str) for item in value):
+                    locators.add((value[0], value[1].replace("{}", SAMPLE_VALUE)))
+
+    return sorted(locators)
+
+
+def build_fixture(locators, filler_count: int) -> str:
+    """HTML page with an element per data-testid used by the locators, text set to the sample value."""
+    test_ids = sorted({
+        test_id for _, value in locators for test_id in re.findall(r"data-testid=['\"]([^'\"{]*)['\"]", value)
+    })
+    fillers = "".join(f"<div class='row'><span>filler {index}</span></div>" for index in range(filler_count))
+    targets = "".join(
+        f"<div data-testid='{test_id}'>{SAMPLE_VALUE} (+{SAMPLE_VALUE})"
+        f"<span data-testid='{test_id}'>{SAMPLE_VALUE}</span><li>{SAMPLE_VALUE}</li></div>"
+        for test_id in test_ids
+    )
+    return f"<!DOCTYPE html><html><body><main>{fillers}{targets}</main></body></html>"
+
+
+def measure(locators, iterations: int, filler_count: int, headless=True) -> dict:
+    """Per locator: (original us, compiled us, original matches, compiled matches), measured in the page."""
+    from src.core.driver.web_driver import WebDriver
+
+    pairs = [(locator, classify_web_locator(locator)[1]) for locator in locators]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        fixture = Path(tmp_dir) / "locators.html"
+        fixture.write_text(build_fixture(locators, filler_count), encoding="utf-8")
+
+        driver = WebDriver.create_driver("chrome", headless=headless)
+        try:
+            driver.get(fixture.as_uri())
+            timings = driver.execute_script(MEASURE_LOOKUPS, [list(map(list, pair)) for pair in pairs], iterations)
+
+        finally:
+            driver.quit()
+
+    return dict(zip(locators, timings))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Web locator optimizer report")
+    parser.add_argument("--no-timings", action="store_true", help="Only classify, do not launch a browser")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--fillers", type=int, default=2000, help="Filler elements of the HTML fixture")
+    args = parser.parse_args()
+
+    locators = collect_locators()
+    kinds = {locator: classify_web_locator(locator)[0] for locator in locators}
+    timings = {} if args.no_timings else measure(locators, args.iterations, args.fillers)
+
+    for kind in ("css", "css filter", "xpath"):
+        print(f"\n== {kind} ==")
+        for locator in (locator for locator in locators if kinds[locator] == kind):
+            if locator in timings:
+                original, compiled, original_count, compiled_count = timings[locator]
+                mismatch = "" if original_count == compiled_count else f"  !! {original_count} vs {compiled_count} matches"
+                timing = f"{original:8.1f}us -> {compiled:8.1f}us  " if kind != "xpath" else f"{original:8.1f}us  "
+                print(f"{timing}{locator[1]}{mismatch}")
+            else:
+                print(locator[1])
+
+    print("\n" + ", ".join(f"{kind}: {count}" for kind, count in sorted(Counter(kinds.values()).items())))
@@ -1,15 +1,25 @@
 import os.path
+import random
 import shutil
 
 import allure
+import allure_commons
 import pytest
 
+from src.core.actions.web_actions import WebActions
 from src.core.config_manager import Config
+from src.core.driver.appium_driver import AppiumDriver
 from src.core.driver.driver_manager import DriverManager
-from src.data.consts import ROOTDIR, VIDEO_DIR
-from src.data.project_info import DriverList
-from src.utils.allure_utils import log_step_to_allure, custom_allure_report, capture_and_attach_video
+from src.core.driver.driver_pool import WebDriverPool
+from src.core.session_cache import SessionCache
+from src.data.consts import ROOTDIR, DRIVER_POOL_SIZE, DRIVER_MAX_USES, SESSION_CACHE_TTL, WAIT_ENGINE, STEP_LOG_LIMIT
+from src.data.project_info import DriverList, StepLogs
+from src.utils.allure_utils import log_step_to_allure, capture_and_attach_video, result_tracker
+from src.utils.file_utils import get_video_dir
 from src.utils.logging_utils import logger
+from src.utils.profiling_utils import ActionProfiler, CommandProfiler
+from src.utils.screenshot_utils import ScreenshotPipeline
+from src.utils.xdist_utils import RANDOM_SEED_KEY, random_seed_key, WorkerOutputs, is_xdist_controller, is_xdist_worker, set_worker_output
 
 
 def pytest_addoption(parser: pytest.Parser):
@@ -24,11 +34,70 @@ def pytest_addoption(parser: pytest.Parser):
     parser.addoption("--browser", default="chrome", help="Browser for web tests (chrome, firefox, safari)")
     parser.addoption("--headless", default=False, action="store_true", help="Run browser in headless mode")
     parser.addoption("--grid", default=False, action="store_true", help="Run browser in headless mode")
+    parser.addoption("--pool-size", default=DRIVER_POOL_SIZE, type=int, help="Number of warm browsers kept between web tests")
+    parser.addoption("--driver-max-uses", default=DRIVER_MAX_USES, type=int, help="Number of tests served by one browser before it is recycled")
+    parser.addoption("--reuse-session", default=False, action="store_true", help="Keep the Android session between tests, restarting the app instead")
+    parser.addoption("--clear-app-data", default=False, action="store_true", help="Clear Android app data when a reused session is reset")
+    parser.addoption("--wait-engine", default=WAIT_ENGINE, choices=["polling", "observer"],
+                     help="Web waits: poll every 0.5s, or let an in-page MutationObserver resolve them")
+    parser.addoption("--no-prewarm", default=False, action="store_true", help="Do not launch the next test browser in the background")
+    parser.addoption("--profile-actions", default=False, action="store_true", help="Record the timings of every action, attached to the allure results")
+    parser.addoption("--profile-commands", default=False, action="store_true", help="Count and time the driver commands of every test, attached to the allure results")
+    parser.addoption("--step-log-limit", default=STEP_LOG_LIMIT, type=int, help="Steps and verifies kept per test for the report, the oldest are dropped first, 0 keeps all")
+    parser.addoption("--session-ttl", default=SESSION_CACHE_TTL, type=int, help="Seconds a cached login session is reused, 0 always logs in through the UI")
+
+
+def pytest_configure(config: pytest.Config):
+    if is_xdist_worker(config):
+        # Every worker must collect the same parametrized tests (random_values is used in parametrize)
+        random.seed(config.workerinput[RANDOM_SEED_KEY])
+
+    if config.option.allure_report_dir:
+        allure_commons.plugin_manager.register(result_tracker)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share one random seed from the xdist controller to all workers."""
+    node.workerinput[RANDOM_SEED_KEY] = node.config.stash.setdefault(random_seed_key, random.randrange(2 ** 32))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the values published by a finished xdist worker."""
+    WorkerOutputs.collect(node)
+
+
+def pytest_collection_finish(session: pytest.Session):
+    if is_xdist_worker(session.config):
+        # collection is done, random test data must differ between workers again
+        random.seed()
+
+    if session.items and not session.config.option.collectonly and Config.get_value("platform") == "web":
+        # the first browsers start while the first test is being set up
+        DriverManager.prepare_spare()
+        DriverManager.prepare_pool()
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem):
+    """Scope the step logs to the test: outermost wrapper, they are dropped once allure reported the test"""
+    StepLogs.begin(item.nodeid)
+    yield
+
+    stats = StepLogs.end()
+    logger.debug(
+        f"- Step logs of {stats['test']}: {stats['entries']} kept, {stats['evicted']} dropped, "
+        f"~{stats['memory']} bytes (peak ~{StepLogs.peak_memory} bytes)"
+    )
 
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_runtest_setup(item: pytest.Item):
     """Setup test and configure Allure reporting"""
+    ActionProfiler.reset()
+    CommandProfiler.reset()
+    ScreenshotPipeline.reset()
 
     # Set up Allure test structure
     server = getattr(item.callspec, "params", {}).get("server", "mt4").upper()
@@ -61,6 +130,7 @@ def pytest_sessionstart(session: pytest.Session):
 
     logger.info(">> Load environment configuration")
     Config.load_config(session.config.getoption("env"))
+    Config.set_value("env", session.config.getoption("env"))
 
     Config.set_value("client", session.config.getoption("client"))
     logger.info(f">> Client: {Config.get_value("client")!r}")
@@ -75,13 +145,66 @@ def pytest_sessionstart(session: pytest.Session):
     Config.set_value("headless", session.config.getoption("headless"))
     Config.set_value("allure_dir", session.config.getoption("allure_report_dir"))
 
+    Config.set_value("pool_size", session.config.getoption("pool_size"))
+    Config.set_value("driver_max_uses", session.config.getoption("driver_max_uses"))
+    WebDriverPool.configure(Config.get_value("pool_size"), Config.get_value("driver_max_uses"))
+
+    Config.set_value("reuse_session", session.config.getoption("reuse_session"))
+    Config.set_value("clear_app_data", session.config.getoption("clear_app_data"))
+    AppiumDriver.configure(Config.get_value("reuse_session"), Config.get_value("clear_app_data"))
+
+    Config.set_value("wait_engine", session.config.getoption("wait_engine"))
+    WebActions.configure(Config.get_value("wait_engine"))
+
+    Config.set_value("prewarm", not session.config.getoption("no_prewarm"))
+    DriverManager.configure(Config.get_value("prewarm"))
+
+    Config.set_value("session_ttl", session.config.getoption("session_ttl"))
+    SessionCache.configure(Config.get_value("session_ttl"))
+
+    Config.set_value("profile_actions", session.config.getoption("profile_actions"))
+    ActionProfiler.configure(Config.get_value("profile_actions"))
+
+    Config.set_value("profile_commands", session.config.getoption("profile_commands"))
+    CommandProfiler.configure(Config.get_value("profile_commands"))
+
+    Config.set_value("step_log_limit", session.config.getoption("step_log_limit"))
+    StepLogs.configure(Config.get_value("step_log_limit"))
+
 
 def pytest_sessionfinish(session: pytest.Session):
-    DriverManager.quit_driver(Config.config["platform"])
+    DriverManager.shutdown(Config.config["platform"])
+    ScreenshotPipeline.flush()
+
+    if ActionProfiler.enabled:
+        set_worker_output(session.config, "action_profile", ActionProfiler.totals)
+        if is_xdist_controller(session.config):
+            for totals in WorkerOutputs.get("action_profile"):
+                ActionProfiler.merge(totals)
+
+        if not is_xdist_worker(session.config):
+            logger.debug(f"Action profile saved to {ActionProfiler.save_summary()}")
+
+    if CommandProfiler.enabled:
+        set_worker_output(session.config, "command_profile", CommandProfiler.session_samples)
+        if is_xdist_controller(session.config):
+            for samples in WorkerOutputs.get("command_profile"):
+                CommandProfiler.merge(samples)
+
+        if not is_xdist_worker(session.config):
+            logger.debug(f"Command profile saved to {CommandProfiler.save_summary()}")
 
     allure_dir = session.config.option.allure_report_dir
     if allure_dir and os.path.exists(ROOTDIR / allure_dir):
-        custom_allure_report(allure_dir)  # custom allure report
+        customized = result_tracker.customized  # results are customized while they are reported
+        set_worker_output(session.config, "customized_results", customized)
+
+        if is_xdist_worker(session.config):
+            return  # the controller writes the report properties once all workers are done
+
+        if is_xdist_controller(session.config):
+            customized = sum(WorkerOutputs.get("customized_results"))
+        logger.debug(f"Customized {customized} allure result(s)")
 
         # Set allure report properties
         _platform = session.config.getoption("platform")
@@ -106,10 +229,19 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     report = outcome.get_result()
 
+    # keep phase reports on the item so fixtures can tell whether the test failed
+    setattr(item, f"rep_{report.when}", report)
+
     platform = Config.get_value("platform")
     driver = DriverList.all_drivers.get(platform)
     allure_dir = item.config.option.allure_report_dir
 
+    if report.when == "call" and ActionProfiler.enabled and allure_dir:
+        allure.attach(ActionProfiler.export(), name="Action profile", attachment_type=allure.attachment_type.JSON)
+
+    if report.when == "call" and CommandProfiler.enabled and allure_dir:
+        allure.attach(CommandProfiler.export(), name="Command profile", attachment_type=allure.attachment_type.JSON)
+
     if not driver:
         return
 
@@ -138,7 +270,8 @@ def pytest_runtest_makereport(item, call):
 @pytest.fixture(scope="session", autouse=True)
 def setup_video_folder():
     if Config.get_value("platform") in ["android", "ios"] and Config.get_value("allure_dir"):
-        if os.path.exists(VIDEO_DIR):
-            shutil.rmtree(VIDEO_DIR)
+        # each xdist worker only cleans its own folder
+        if os.path.exists(get_video_dir()):
+            shutil.rmtree(get_video_dir())
 
-        os.makedirs(VIDEO_DIR)
+        os.makedirs(get_video_dir())
@@ -1,17 +1,19 @@
 from functools import wraps
 from typing import Union
 
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
+from src.core.actions.retry_policy import RetryPolicy
 from src.data.consts import EXPLICIT_WAIT
 from src.data.project_info import StepLogs
 from src.utils.allure_utils import capture_and_attach_screenshot
 from src.utils.assert_utils import soft_assert
 from src.utils.logging_utils import logger
+from src.utils.profiling_utils import profile_actions
 
 
 def handle_broken_steps(func):
@@ -23,9 +25,7 @@ def handle_broken_steps(func):
             return func(self, *args, **kwargs)
         except Exception as e:
             # Save broken steps for custom report
-            StepLogs.broken_steps.append(StepLogs.test_steps[-1])
-            if "verify" in StepLogs.test_steps[-1].lower():
-                StepLogs.broken_steps.append([item for item in StepLogs.test_steps if "step" in item.lower()][-1])
+            StepLogs.mark_broken()
 
             capture_and_attach_screenshot(self._driver, name="broken")
             raise e
@@ -33,50 +33,60 @@ def handle_broken_steps(func):
     return wrapper
 
 
+@profile_actions
 class BaseActions:
     DEFAULT_CONDITION = EC.visibility_of_element_located
+    # profiling: time spent in these methods is wait time, public methods listed below are not profiled
+    PROFILED_WAITS = ("_wait_until", "_until", "_wait_locators", "_observe", "_network_wait")
+    NOT_PROFILED = ("snapshot", "invalidate_snapshot", "mark_network")
+    retry_policy = RetryPolicy()
 
     def __init__(self, driver):
         self._driver = driver
         self._wait = WebDriverWait(driver=self._driver, timeout=EXPLICIT_WAIT)
         self._action_chains = ActionChains(self._driver)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        profile_actions(cls)
+
     @handle_broken_steps
     def _find_element(
             self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, retries=1, cond=DEFAULT_CONDITION
     ) -> Union[WebElement, list[WebElement]]:
-        """Find single element with retry mechanism. Raises Exception if not found after retries."""
-        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
-
-        for i in range(retries):
-            try:
-                return wait.until(cond(locator))
-
-            except (TimeoutException, StaleElementReferenceException, NoSuchElementException) as e:
-                logger.warning(f"Attempt {i + 1}/{retries} failed for {locator}: {type(e).__name__}")
-
-            except Exception as e:
-                logger.error(f"Unexpected error for {locator}: {type(e).__name__}")
+        """Find single element, retried by the retry policy within `timeout`. Raises Exception if not found."""
+        try:
+            return self.retry_policy.run(
+                lambda attempt_timeout: self._wait_until(locator, cond, attempt_timeout), locator, timeout, retries
+            )
 
-        raise Exception(f"Element with locator {locator} not found after {retries} attempt(s)")
+        except Exception as e:
+            raise Exception(f"Element with locator {locator} not found after {retries} attempt(s)") from e
 
     def _find_elements(
             self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, retries=1
     ) -> list[WebElement]:
-        """Find multiple elements with retry mechanism. Returns empty list if none found."""
-        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
+        """Find multiple elements, retried by the retry policy within `timeout`. Returns empty list if none found."""
+        try:
+            return self.retry_policy.run(
+                lambda attempt_timeout: self._wait_until(locator, EC.presence_of_all_elements_located, attempt_timeout),
+                locator, timeout, retries
+            )
 
-        for i in range(retries):
-            try:
-                return wait.until(EC.presence_of_all_elements_located(locator))
+        except Exception:
+            return []
 
-            except (TimeoutException, StaleElementReferenceException, NoSuchElementException) as e:
-                logger.warning(f"Attempt {i + 1}/{retries} failed for {locator}: {type(e).__name__}")
+    def _wait_until(self, locator: tuple[str, str], cond=DEFAULT_CONDITION, timeout=EXPLICIT_WAIT):
+        """Wait for the expected condition on the locator, raise TimeoutException when it is not met in time."""
+        return self._until(cond(self._resolve_locator(locator)), timeout)
 
-            except Exception as e:
-                logger.error(f"Unexpected error for {locator}: {type(e).__name__}")
+    def _until(self, condition, timeout=EXPLICIT_WAIT):
+        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
+        return wait.until(condition)
 
-        return []
+    def _resolve_locator(self, locator: tuple[str, str]) -> tuple[str, str]:
+        """Locator actually sent to the driver, subclasses may rewrite it into a faster equivalent."""
+        return locator
 
     def click(
             self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, retries=1, cond=DEFAULT_CONDITION
@@ -116,6 +126,187 @@ class BaseActions:
         element = self._find_element(locator, timeout, retries, cond)
         return element.text
 
+    def read_elements(
+            self, locators: list[tuple[str, str]], properties=("text",), all_matches=False,
+            timeout=EXPLICIT_WAIT, until_displayed=False
+    ) -> list:
+        """
+        Read several properties of many elements at once.
+        Properties are "text", "displayed" or attribute names, each locator gives a {property: value} dict
+        of its first match (None when not found), or a list of dicts for every match with `all_matches`.
+        Waits until every locator matches (is displayed with `until_displayed`), then returns what was read last.
+        """
+        locators, properties = [tuple(locator) for locator in locators], list(properties)
+        if until_displayed and "displayed" not in properties:
+            properties.append("displayed")
+        results = [[] if all_matches else None for _ in locators]
+
+        def _ready(_):
+            nonlocal results
+            try:
+                results = self._read_elements_once(locators, properties, all_matches)
+
+            except StaleElementReferenceException:
+                return False
+
+            matches = [result if all_matches else [result] if result else [] for result in results]
+            if until_displayed:
+                ready = all(any(item.get("displayed") for item in match) for match in matches)
+            else:
+                ready = all(matches)
+
+            if not ready:
+                self._forget_screen()
+
+            return ready
+
+        try:
+            self._until(_ready, timeout)
+
+        except TimeoutException:
+            missing = [locator for locator, result in zip(locators, results) if not result]
+            logger.debug(f"- Timed out reading elements, not found: {missing}")
+
+        return results
+
+    @handle_broken_steps
+    def _read_found(
+            self, locators: list[tuple[str, str]], properties, timeout=EXPLICIT_WAIT, until_displayed=True
+    ) -> list[dict]:
+        """Read the first match of every locator like `_find_element` finds it, raise if any never shows up."""
+        results = self.read_elements(locators, properties, timeout=timeout, until_displayed=until_displayed)
+        missing = [
+            locator for locator, result in zip(locators, results)
+            if result is None or (until_displayed and not result["displayed"])
+        ]
+        if missing:
+            raise Exception(f"Elements with locators {missing} not found after {timeout}s")
+
+        return results
+
+    def get_texts(self, locators: list[tuple[str, str]], timeout=EXPLICIT_WAIT) -> list[str]:
+        """Get the text of each locator first match once all of them are displayed."""
+        return [result["text"] for result in self._read_found(locators, ("text",), timeout)]
+
+    def get_all_texts(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT) -> list[str]:
+        """Get the text of every element matching the locator."""
+        results = self.read_elements([locator], ("text",), all_matches=True, timeout=timeout)
+        return [item["text"] for item in results[0]]
+
+    def get_attributes(
+            self, locators: list[tuple[str, str]], attribute: str, timeout=EXPLICIT_WAIT
+    ) -> list[str | None]:
+        """Get an attribute of each locator first match once all of them are displayed."""
+        return [result[attribute] for result in self._read_found(locators, (attribute,), timeout)]
+
+    def get_all_attributes(self, locator: tuple[str, str], attribute: str, timeout=EXPLICIT_WAIT) -> list:
+        """Get an attribute of every element matching the locator."""
+        results = self.read_elements([locator], (attribute,), all_matches=True, timeout=timeout)
+        return [item[attribute] for item in results[0]]
+
+    def are_displayed(self, locators: list[tuple[str, str]], timeout=EXPLICIT_WAIT) -> list[bool]:
+        """Check which locators are displayed, waiting up to `timeout` for all of them to be."""
+        results = self.read_elements(locators, ("displayed",), timeout=timeout, until_displayed=True)
+        return [bool(result and result["displayed"]) for result in results]
+
+    def probe(self, locator: tuple[str, str], displayed=True) -> bool:
+        """Tell from one snapshot of the current screen whether the element is there (and displayed), no waiting."""
+        try:
+            result = self._read_elements_once([tuple(locator)], ("displayed",), False)[0]
+
+        except StaleElementReferenceException:
+            return False
+
+        return bool(result) and (result["displayed"] or not displayed)
+
+    def wait_all(
+            self, locators: list[tuple[str, str]], timeout=EXPLICIT_WAIT, displayed=True
+    ) -> dict[tuple[str, str], bool]:
+        """
+        Wait until every locator is displayed (only present without `displayed`), all checked together on each poll.
+        Return {locator: met}, False for the ones still not met when the timeout is over.
+        """
+        return self._wait_locators([tuple(locator) for locator in locators], True, displayed, timeout)
+
+    def wait_any(
+            self, locators: list[tuple[str, str]], timeout=EXPLICIT_WAIT, displayed=True
+    ) -> dict[tuple[str, str], bool]:
+        """Wait until one of the locators is displayed (only present without `displayed`), return {locator: met}."""
+        return self._wait_locators([tuple(locator) for locator in locators], False, displayed, timeout)
+
+    def wait_first(self, locators: list[tuple[str, str]], timeout=EXPLICIT_WAIT) -> tuple[str, str] | None:
+        """
+        Wait until one of the locators is displayed and return it, None when none is within the timeout.
+        When several are displayed at once, the one coming first in `locators` wins.
+        """
+        first = next((locator for locator, met in self.wait_any(locators, timeout).items() if met), None)
+        if first is None:
+            logger.debug(f"- None of {locators} displayed after {timeout}s")
+
+        return first
+
+    def _wait_locators(self, locators: list[tuple[str, str]], require_all: bool, displayed: bool, timeout) -> dict:
+        states = dict.fromkeys(locators, False)
+        if not locators:
+            return states
+
+        def _met(_):
+            try:
+                results = self._read_elements_once(locators, ("displayed",), False)
+
+            except StaleElementReferenceException:
+                return False
+
+            states.update({
+                locator: bool(result) and (result["displayed"] or not displayed)
+                for locator, result in zip(locators, results)
+            })
+            if all(states.values()) if require_all else any(states.values()):
+                return True
+
+            self._forget_screen()
+            return False
+
+        try:
+            self._until(_met, timeout)
+
+        except TimeoutException:
+            logger.debug(f"- Timed out waiting for {[locator for locator, met in states.items() if not met]}")
+
+        return states
+
+    def _read_elements_once(self, locators, properties, all_matches) -> list:
+        """Read the elements right away, one driver command per element and property."""
+        results = []
+
+        for locator in locators:
+            elements = self._driver.find_elements(*self._resolve_locator(locator))
+            if not all_matches:
+                elements = elements[:1]
+
+            items = [
+                {name: self._read_property(element, name) for name in properties} for element in elements
+            ]
+            results.append(items if all_matches else (items[0] if items else None))
+
+        return results
+
+    def _forget_screen(self):
+        """Drop any cached view of the screen, called when a wait needs to look at a newer one."""
+        pass
+
+    @staticmethod
+    def _read_property(element: WebElement, name: str):
+        match name:
+            case "text":
+                return element.text.strip()
+
+            case "displayed":
+                return element.is_displayed()
+
+            case _:
+                return element.get_attribute(name)
+
     def wait_for_element_invisible(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, retries=1):
         self._find_element(locator, timeout, retries, cond=EC.invisibility_of_element_located)
 
@@ -123,11 +314,16 @@ class BaseActions:
             self, locator: tuple[str, str], timeout=EXPLICIT_WAIT
     ) -> bool:
         """Check if element is displayed."""
-        wait = self._wait if timeout == EXPLICIT_WAIT else WebDriverWait(self._driver, timeout)
+        try:
+            return bool(self._wait_until(locator, EC.visibility_of_element_located, timeout))
 
+        except Exception:
+            return False
+
+    def is_element_invisible(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT) -> bool:
+        """Check if element is invisible or gone, waiting up to `timeout` for it to disappear."""
         try:
-            element = wait.until(EC.visibility_of_element_located(locator))
-            return element.is_displayed()
+            return bool(self._wait_until(locator, EC.invisibility_of_element_located, timeout))
 
         except Exception:
             return False
@@ -139,3 +335,8 @@ class BaseActions:
         soft_assert(
             self.is_element_displayed(locator, timeout), True, f"Element with locator {locator} is not displayed"
         )
+
+    def verify_elements_are_displayed(self, locators: list[tuple[str, str]], timeout=EXPLICIT_WAIT):
+        """Verify several elements within one wait window, each missing element is reported on its own."""
+        for locator, displayed in self.wait_all(locators, timeout).items():
+            soft_assert(displayed, True, f"Element with locator {locator} is not displayed")
@@ -0,0 +1,197 @@
+import json
+import re
+from functools import lru_cache
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+from src.utils.logging_utils import logger
+
+# //* or //class.Name with one predicate made of conditions joined by 'and', nothing else
+_SIMPLE_XPATH = re.compile(r"^//(?P<cls>\*|[A-Za-z_][\w.$]*)\[(?P<conditions>[^\[\]]+)\]$")
+_CONDITION = re.compile(
+    r"\s*(?:"
+    r"@(?P<attr>[\w-]+)\s*=\s*'(?P<value>[^']*)'"
+    r"|(?P<func>contains|starts-with)\(\s*@(?P<func_attr>[\w-]+)\s*,\s*'(?P<func_value>[^']*)'\s*\)"
+    r")\s*"
+)
+_AND = re.compile(r"and\b")
+
+# XPath attribute (and function) -> UiSelector method
+_SELECTORS = {
+    ("resource-id", None): "resourceId",
+    ("text", None): "text",
+    ("content-desc", None): "description",
+    ("class", None): "className",
+    ("text", "contains"): "textContains",
+    ("content-desc", "contains"): "descriptionContains",
+    ("text", "starts-with"): "textStartsWith",
+    ("content-desc", "starts-with"): "descriptionStartsWith",
+}
+
+
+@lru_cache(maxsize=2048)
+def compile_locator(locator: tuple[str, str]) -> tuple[str, str]:
+    """
+    Rewrite a simple Android XPath locator into the equivalent UiSelector, which UiAutomator2 resolves
+    without dumping the whole UI hierarchy. Locators that cannot be rewritten safely (axes, nested paths,
+    positional predicates, 'or', ...) are returned unchanged.
+    """
+    by, value = locator
+    if by != AppiumBy.XPATH:
+        return locator
+
+    selector = _to_ui_selector(value)
+    if selector is None:
+        return locator
+
+    logger.debug(f"- Compiled locator {value!r} -> {selector!r}")
+    return AppiumBy.ANDROID_UIAUTOMATOR, selector
+
+
+def _to_ui_selector(xpath: str) -> str | None:
+    match = _SIMPLE_XPATH.match(xpath.strip())
+    if not match:
+        return None
+
+    calls = [] if match["cls"] == "*" else [("className", match["cls"])]
+    conditions, pos = match["conditions"], 0
+
+    while True:
+        condition = _CONDITION.match(conditions, pos)
+        if not condition:
+            return None
+
+        if condition["attr"]:
+            method = _SELECTORS.get((condition["attr"], None))
+            argument = condition["value"]
+        else:
+            method = _SELECTORS.get((condition["func_attr"], condition["func"]))
+            argument = condition["func_value"]
+
+        if method is None:
+            return None
+
+        calls.append((method, argument))
+        pos = condition.end()
+
+        if pos == len(conditions):
+            break
+
+        separator = _AND.match(conditions, pos)
+        if not separator:
+            return None
+        pos = separator.end()
+
+    return "new UiSelector()" + "".join(f'.{method}("{_escape(argument)}")' for method, argument in calls)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+# ---------------------------------------- WEB ---------------------------------------- #
+# Custom strategy resolved in the page by `scripts.FIND_ELEMENTS`: a CSS selector plus a text filter and/or an index
+CSS_FILTER = "css filter"
+
+_WEB_STEP = re.compile(r"(?P<axis>//|/)(?P<tag>\*|[A-Za-z][\w-]*)(?:\[(?P<conditions>[^\[\]]+)\])?")
+_WEB_INDEXED = re.compile(r"^\((?P<path>.+)\)\[(?P<index>[1-9]\d*)\]$")
+_WEB_CONDITION = re.compile(
+    r"\s*(?:"
+    r"@(?P<attr>[\w-]+)\s*=\s*'(?P<value>[^']*)'"
+    r"|(?P<func>contains|starts-with)\(\s*@(?P<func_attr>[\w-]+)\s*,\s*'(?P<func_value>[^']*)'\s*\)"
+    r"|@(?P<has_attr>[\w-]+)"
+    r"|text\(\)\s*=\s*'(?P<text>[^']*)'"
+    r"|contains\(\s*text\(\)\s*,\s*'(?P<text_contains>[^']*)'\s*\)"
+    r")\s*"
+)
+_CSS_OPERATORS = {None: "=", "contains": "*=", "starts-with": "^="}
+
+
+@lru_cache(maxsize=2048)
+def classify_web_locator(locator: tuple[str, str]) -> tuple[str, tuple[str, str]]:
+    """
+    Classify a web locator and return it with its fastest equivalent:
+    - "native": not an XPath, used as is
+    - "css": XPath with a pure CSS equivalent
+    - "css filter": XPath matching text or picking the n-th match, resolved by CSS plus a filter in the page
+    - "xpath": kept as XPath (axes, 'or', functions CSS has no equivalent for, ...)
+    """
+    by, value = locator
+    if by != "xpath":
+        return "native", locator
+
+    spec = _to_css_spec(value.strip())
+    if spec is None:
+        return "xpath", locator
+
+    if spec["text"] is None and spec["index"] is None:
+        return "css", ("css selector", spec["css"])
+
+    return CSS_FILTER, (CSS_FILTER, json.dumps(spec, ensure_ascii=False))
+
+
+def compile_web_locator(locator: tuple[str, str]) -> tuple[str, str]:
+    return classify_web_locator(tuple(locator))[1]
+
+
+def _to_css_spec(xpath: str) -> dict | None:
+    index = None
+    indexed = _WEB_INDEXED.match(xpath)
+    if indexed:
+        xpath, index = indexed["path"], int(indexed["index"])
+
+    selectors, text, match, pos = [], None, None, 0
+    while pos < len(xpath):
+        step = _WEB_STEP.match(xpath, pos)
+        if not step or text is not None:  # a text condition is only supported on the last step
+            return None
+
+        if not selectors and step["axis"] != "//":
+            return None
+
+        selector = step["tag"]
+        if step["conditions"]:
+            parsed = _parse_web_conditions(step["conditions"])
+            if parsed is None:
+                return None
+
+            attributes, text, match = parsed
+            selector += attributes
+
+        combinator = "" if not selectors else " " if step["axis"] == "//" else " > "
+        selectors.append(combinator + selector)
+        pos = step.end()
+
+    return dict(css="".join(selectors), text=text, match=match, index=index) if selectors else None
+
+
+def _parse_web_conditions(conditions: str) -> tuple[str, str | None, str | None] | None:
+    attributes, text, match, pos = "", None, None, 0
+
+    while True:
+        condition = _WEB_CONDITION.match(conditions, pos)
+        if not condition:
+            return None
+
+        if condition["attr"]:
+            attributes += f'[{condition["attr"]}="{_escape(condition["value"])}"]'
+        elif condition["func"]:
+            operator = _CSS_OPERATORS[condition["func"]]
+            attributes += f'[{condition["func_attr"]}{operator}"{_escape(condition["func_value"])}"]'
+        elif condition["has_attr"]:
+            attributes += f'[{condition["has_attr"]}]'
+        elif text is not None:
+            return None  # several text conditions
+        elif condition["text"] is not None:
+            text, match = condition["text"], "equals"
+        else:
+            text, match = condition["text_contains"], "contains"
+
+        pos = condition.end()
+        if pos == len(conditions):
+            return attributes, text, match
+
+        separator = _AND.match(conditions, pos)
+        if not separator:
+            return None
+        pos = separator.end()
@@ -1,15 +1,177 @@
+from contextlib import contextmanager
+from functools import wraps
 from typing import Optional, Tuple, Union
+
+from appium.webdriver.common.appiumby import AppiumBy
+from lxml import etree
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 
-from src.core.actions.base_actions import BaseActions
+from src.core.actions.base_actions import BaseActions, handle_broken_steps
+from src.core.actions.locator_compiler import compile_locator
 from src.data.consts import EXPLICIT_WAIT
+from src.utils.logging_utils import logger
+
+
+def changes_screen(func):
+    """Decorator for actions changing the screen, the hierarchy snapshot is outdated once they ran."""
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.invalidate_snapshot()
+
+    return wrapper
 
 
 class MobileActions(BaseActions):
+    # locator strategies evaluated on the hierarchy snapshot, the other ones always go to the device
+    SNAPSHOT_STRATEGIES = (AppiumBy.XPATH, AppiumBy.ID, AppiumBy.ACCESSIBILITY_ID, AppiumBy.CLASS_NAME)
+    # Appium attribute names -> attributes of the UiAutomator2 page source
+    SNAPSHOT_ATTRIBUTES = {
+        "contentDescription": "content-desc",
+        "content-desc": "content-desc",
+        "resourceId": "resource-id",
+        "resource-id": "resource-id",
+        "className": "class",
+    }
+
+    compile_locators = True
+
     def __init__(self, driver):
         super().__init__(driver)
+        self._snapshot_depth = 0
+        self._snapshot_root = None
+
+    def _resolve_locator(self, locator: tuple[str, str]) -> tuple[str, str]:
+        """Send simple XPath locators as UiSelector, UiAutomator2 then does not dump the hierarchy to find them."""
+        return compile_locator(tuple(locator)) if self.compile_locators else locator
+
+    # ------- SNAPSHOT ------ #
+    @contextmanager
+    def snapshot(self):
+        """
+        Evaluate the reads, presence checks and verifications of the block on one dump of the UI hierarchy.
+        The dump is fetched on the first read, and again after an action changing the screen
+        or when a wait needs a newer one.
+        """
+        self._snapshot_depth += 1
+        try:
+            yield self
+
+        finally:
+            self._snapshot_depth -= 1
+            if not self._snapshot_depth:
+                self.invalidate_snapshot()
+
+    def invalidate_snapshot(self):
+        self._snapshot_root = None
+
+    def _forget_screen(self):
+        self.invalidate_snapshot()
+
+    def _uses_snapshot(self, *locators) -> bool:
+        return bool(self._snapshot_depth) and all(locator[0] in self.SNAPSHOT_STRATEGIES for locator in locators)
+
+    def _get_snapshot(self):
+        if self._snapshot_root is None:
+            self._snapshot_root = etree.fromstring(self._driver.page_source.encode("utf-8"))
+            logger.debug("- Fetched UI hierarchy snapshot")
+
+        return self._snapshot_root
+
+    def _find_in_snapshot(self, locator: tuple[str, str]) -> list:
+        by, value = locator
+        root = self._get_snapshot()
+
+        match by:
+            case AppiumBy.XPATH:
+                nodes = root.xpath(value)
+
+            case AppiumBy.ID:
+                nodes = [
+                    node for node in root.iter()
+                    if node.get("resource-id") == value or node.get("resource-id", "").endswith(f":id/{value}")
+                ]
+
+            case AppiumBy.ACCESSIBILITY_ID:
+                nodes = [node for node in root.iter() if node.get("content-desc") == value]
+
+            case AppiumBy.CLASS_NAME:
+                nodes = list(root.iter(value))
+
+            case _:
+                raise ValueError(f"Locator strategy {by!r} cannot be evaluated on a snapshot")
+
+        return [node for node in nodes if isinstance(node, etree._Element)]
+
+    def _read_elements_once(self, locators, properties, all_matches) -> list:
+        if not self._uses_snapshot(*locators):
+            return super()._read_elements_once(locators, properties, all_matches)
+
+        results = []
+        for locator in locators:
+            nodes = self._find_in_snapshot(locator)
+            if not all_matches:
+                nodes = nodes[:1]
+
+            items = [{name: self._read_node(node, name) for name in properties} for node in nodes]
+            results.append(items if all_matches else (items[0] if items else None))
+
+        return results
+
+    def _read_node(self, node, name: str):
+        match name:
+            case "text":
+                return node.get("text", "").strip()
+
+            case "displayed":
+                return node.get("displayed", "true") == "true"
+
+            case _:
+                return node.get(self.SNAPSHOT_ATTRIBUTES.get(name, name))
+
+    @handle_broken_steps
+    def _read_snapshot_element(self, locator, name, timeout=EXPLICIT_WAIT, cond=BaseActions.DEFAULT_CONDITION):
+        """Read one property of the first match like `_find_element` would find it, raise if it never shows up."""
+        until_displayed = cond is EC.visibility_of_element_located
+        result = self.read_elements([locator], (name, "displayed"), timeout=timeout, until_displayed=until_displayed)[0]
+
+        if result is None or (until_displayed and not result["displayed"]):
+            raise Exception(f"Element with locator {locator} not found in the UI hierarchy after {timeout}s")
+
+        return result[name]
+
+    # ------- READS ------ #
+    def get_text(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, retries=1, cond=BaseActions.DEFAULT_CONDITION):
+        if not self._uses_snapshot(locator):
+            return super().get_text(locator, timeout, retries, cond)
+
+        return self._read_snapshot_element(locator, "text", timeout, cond)
+
+    def get_attribute(
+            self, locator: tuple[str, str], attribute: str,
+            timeout=EXPLICIT_WAIT, retries=1, cond=BaseActions.DEFAULT_CONDITION
+    ):
+        if not self._uses_snapshot(locator):
+            return super().get_attribute(locator, attribute, timeout, retries, cond)
+
+        return self._read_snapshot_element(locator, attribute, timeout, cond)
+
+    def is_element_displayed(self, locator: tuple[str, str], timeout=EXPLICIT_WAIT) -> bool:
+        if not self._uses_snapshot(locator):
+            return super().is_element_displayed(locator, timeout)
+
+        return self.are_displayed([locator], timeout)[0]
+
+    # ------- ACTIONS ------ #
+    click = changes_screen(BaseActions.click)
+    click_by_offset = changes_screen(BaseActions.click_by_offset)
+    send_keys = changes_screen(BaseActions.send_keys)
 
+    @changes_screen
     def scroll(
             self, source_locator: tuple[str, str], target_locator: tuple[str, str],
             timeout=EXPLICIT_WAIT, retries=1, cond=BaseActions.DEFAULT_CONDITION,
@@ -29,6 +191,7 @@ class MobileActions(BaseActions):
         target_ele = self._find_element(target_locator, timeout, retries, cond)
         self._driver.scroll(source_ele, target_ele, duration)
 
+    @changes_screen
     def scroll_to_text(self, text: str, direction: str = "down"):
         """Scroll until text is found on screen.
         
@@ -41,6 +204,7 @@ class MobileActions(BaseActions):
             f'new UiSelector().text("{text}"))'
         )
 
+    @changes_screen
     def hide_keyboard(self):
         """Hide the keyboard if it's visible."""
         try:
@@ -53,14 +217,17 @@ class MobileActions(BaseActions):
                 # If both methods fail, try pressing back button
                 self.press_back()
 
+    @changes_screen
     def press_back(self):
         """Press device back button."""
         self._driver.press_keycode(4)  # Android back button keycode
 
+    @changes_screen
     def press_home(self):
         """Press device home button."""
         self._driver.press_keycode(3)  # Android home button keycode
 
+    @changes_screen
     def press_enter(
             self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, retries=1,
             cond=BaseActions.DEFAULT_CONDITION
@@ -0,0 +1,84 @@
+import json
+import random
+import time
+
+from selenium.common.exceptions import (
+    TimeoutException, StaleElementReferenceException, NoSuchElementException, InvalidSelectorException,
+    InvalidArgumentException, InvalidSessionIdException, NoSuchWindowException
+)
+
+from src.utils.logging_utils import logger
+from src.utils.profiling_utils import ActionProfiler
+
+
+class RetryPolicy:
+    """
+    How element lookups are retried:
+    - `timeout` is the deadline of the whole lookup, split evenly over the attempts left
+    - a failed attempt is followed by an exponential backoff with jitter, within the deadline
+    - a stale element is looked up again right away, without using an attempt (up to `max_relookups` times)
+    - unrecoverable errors (invalid selector, closed window or session) are not retried
+    Every decision is logged as a JSON line for the retry telemetry.
+    """
+    RETRY_ON = (TimeoutException, NoSuchElementException)
+    RELOOKUP_ON = (StaleElementReferenceException,)
+    ABORT_ON = (InvalidSelectorException, InvalidArgumentException, InvalidSessionIdException, NoSuchWindowException)
+
+    def __init__(self, backoff=0.2, max_backoff=2.0, jitter=0.5, max_relookups=3):
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.max_relookups = max_relookups
+
+    def run(self, lookup, locator, timeout, retries=1):
+        """
+        Call `lookup(attempt_timeout)` until it returns, raise the last error once the attempts
+        or the deadline are used up.
+        """
+        start = time.monotonic()
+        deadline = start + timeout
+        attempt, relookups, error = 0, 0, None
+
+        while attempt < max(retries, 1):
+            remaining = max(deadline - time.monotonic(), 0)
+            try:
+                return lookup(remaining / (max(retries, 1) - attempt))
+
+            except Exception as e:
+                error = e
+
+            if isinstance(error, self.ABORT_ON):
+                self._telemetry(locator, attempt, retries, error, "abort", start)
+                break
+
+            if isinstance(error, self.RELOOKUP_ON) and relookups < self.max_relookups:
+                relookups += 1
+                self._telemetry(locator, attempt, retries, error, "relookup", start)
+                continue
+
+            if not isinstance(error, self.RETRY_ON + self.RELOOKUP_ON):
+                logger.error(f"Unexpected error for {locator}: {type(error).__name__}")
+
+            logger.warning(f"Attempt {attempt + 1}/{retries} failed for {locator}: {type(error).__name__}")
+            attempt += 1
+            if attempt >= retries or time.monotonic() >= deadline:
+                self._telemetry(locator, attempt, retries, error, "give up", start)
+                break
+
+            delay = min(self._backoff(attempt), max(deadline - time.monotonic(), 0))
+            self._telemetry(locator, attempt, retries, error, "retry", start, delay)
+            ActionProfiler.count_retry()
+            time.sleep(delay)
+
+        raise error
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    @staticmethod
+    def _telemetry(locator, attempt, retries, error, decision, start, delay=0.0):
+        logger.debug("- Retry " + json.dumps(dict(
+            locator=list(locator), attempt=attempt, retries=retries, error=type(error).__name__,
+            decision=decision, elapsed=round(time.monotonic() - start, 3), delay=round(delay, 3)
+        )))
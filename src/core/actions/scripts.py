@@ -0,0 +1,318 @@
+"""
+JavaScript snippets run in the browser by WebActions.
+Locators are passed as (by, value) pairs, `FIND_ELEMENTS` resolves them the way Selenium does,
+plus the "css filter" strategy of compiled XPath locators (see `locator_compiler.compile_web_locator`).
+"""
+
+# Defines `findAll(by, value)` and `isVisible(element)`, prepend it to scripts needing them
+FIND_ELEMENTS = """
+const findAll = (by, value, root = document) => {
+    switch (by) {
+        case "css selector":
+            return Array.from(root.querySelectorAll(value));
+        case "xpath": {
+            const snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+        }
+        case "id":
+            return Array.from(root.querySelectorAll(`#${CSS.escape(value)}`));
+        case "name":
+            return Array.from(root.querySelectorAll(`[name="${CSS.escape(value)}"]`));
+        case "class name":
+            return Array.from(root.querySelectorAll(`.${CSS.escape(value)}`));
+        case "tag name":
+            return Array.from(root.getElementsByTagName(value));
+        case "link text":
+            return Array.from(root.querySelectorAll("a")).filter(a => a.innerText.trim() === value);
+        case "partial link text":
+            return Array.from(root.querySelectorAll("a")).filter(a => a.innerText.includes(value));
+        case "css filter": {
+            // same matching as XPath: text()='x' tests every own text node, contains(text(), 'x') the first one
+            const {css, text, match, index} = JSON.parse(value);
+            let elements = Array.from(root.querySelectorAll(css));
+            if (text !== null) {
+                elements = elements.filter(element => {
+                    const texts = Array.from(element.childNodes)
+                        .filter(node => node.nodeType === Node.TEXT_NODE)
+                        .map(node => node.data);
+                    return match === "equals" ? texts.includes(text) : texts.length > 0 && texts[0].includes(text);
+                });
+            }
+            return index === null ? elements : elements.slice(index - 1, index);
+        }
+        default:
+            throw new Error(`Unsupported locator strategy: ${by}`);
+    }
+};
+
+const isVisible = element => {
+    if (!element.isConnected) return false;
+    const style = window.getComputedStyle(element);
+    if (style.display === "none" || style.visibility === "hidden" || style.opacity === "0") return false;
+    const rect = element.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+};
+"""
+
+# arguments: locators, properties, all matches -> per locator a {property: value} (or a list of them, or null)
+READ_ELEMENTS = FIND_ELEMENTS + """
+const [locators, properties, allMatches] = arguments;
+
+const readAttribute = (element, name) => {
+    // same precedence as Selenium get_attribute: the DOM property, then the HTML attribute
+    const property = name === "class" ? element.className : element[name];
+    if (property === true) return "true";
+    if (property === false) return null;
+    if (property !== undefined && property !== null && typeof property !== "object" && typeof property !== "function") {
+        return String(property);
+    }
+    return element.getAttribute(name);
+};
+
+const read = element => Object.fromEntries(properties.map(name => {
+    if (name === "text") return [name, isVisible(element) ? element.innerText.trim() : ""];
+    if (name === "displayed") return [name, isVisible(element)];
+    return [name, readAttribute(element, name)];
+}));
+
+return locators.map(([by, value]) => {
+    const elements = findAll(by, value);
+    return allMatches ? elements.map(read) : (elements.length ? read(elements[0]) : null);
+});
+"""
+
+# Defines `checkCondition(by, value, mode)`: the expected condition result, undefined while it is not met
+CHECK_CONDITION = """
+const checkCondition = (by, value, mode) => {
+    const elements = findAll(by, value);
+    switch (mode) {
+        case "visible":
+            return elements.length && isVisible(elements[0]) ? elements[0] : undefined;
+        case "invisible":
+            return !elements.length || !isVisible(elements[0]) ? true : undefined;
+        case "present":
+            return elements.length ? elements[0] : undefined;
+        case "present_all":
+            return elements.length ? elements : undefined;
+    }
+};
+"""
+
+# Defines `observe(check, timeout, done)`: calls `done` with the first defined result of `check`, null on timeout.
+# DOM mutations trigger the checks, a slow timer catches pure CSS changes.
+OBSERVE = """
+const observe = (check, timeout, done) => {
+    let finished = false;
+    let observer, timer, fallback;
+    const finish = result => {
+        if (finished) return;
+        finished = true;
+        observer && observer.disconnect();
+        clearTimeout(timer);
+        clearInterval(fallback);
+        done(result === undefined ? null : result);
+    };
+
+    const onChange = () => {
+        let result;
+        try {
+            result = check();
+        } catch (e) {
+            return finish({error: String(e)});
+        }
+        if (result !== undefined) finish(result);
+    };
+
+    onChange();
+    if (!finished) {
+        observer = new MutationObserver(onChange);
+        observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+        fallback = setInterval(onChange, 100);
+        timer = setTimeout(() => finish(null), timeout);
+    }
+};
+"""
+
+# arguments: locator by, locator value, mode, timeout (ms), callback
+# "visible" -> element, "present" -> element, "present_all" -> elements, "invisible" -> true,
+# null on timeout, {error} when the locator cannot be evaluated
+WAIT_FOR_ELEMENT = FIND_ELEMENTS + CHECK_CONDITION + OBSERVE + """
+const [by, value, mode, timeout, done] = arguments;
+
+observe(() => checkCondition(by, value, mode), timeout, done);
+"""
+
+# arguments: locator by, locator value, mode -> same results as WAIT_FOR_ELEMENT, checked once
+CHECK_ELEMENT = FIND_ELEMENTS + CHECK_CONDITION + """
+const [by, value, mode] = arguments;
+const result = checkCondition(by, value, mode);
+return result === undefined ? null : result;
+"""
+
+# arguments: locators, require all (otherwise any), displayed (otherwise present), timeout (ms), callback
+# -> per locator whether its first match is displayed (present), once all (any) of them are; null on timeout
+WAIT_FOR_LOCATORS = FIND_ELEMENTS + OBSERVE + """
+const [locators, requireAll, displayed, timeout, done] = arguments;
+
+observe(() => {
+    const states = locators.map(([by, value]) => {
+        const [first] = findAll(by, value);
+        return first !== undefined && (!displayed || isVisible(first));
+    });
+    return (requireAll ? states.every(Boolean) : states.some(Boolean)) ? states : undefined;
+}, timeout, done);
+"""
+
+# arguments: fields [[by, value, text], ...], timeout (ms), callback -> true once filled, null on timeout
+# Waits for every field to be displayed, then sets the values through the native setter (React tracks the
+# value property, a plain assignment is ignored) and dispatches input/change events like typing would.
+FILL_FORM = FIND_ELEMENTS + OBSERVE + """
+const [fields, timeout, done] = arguments;
+
+const setValue = (element, text) => {
+    const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value");
+    element.focus();
+    if (descriptor && descriptor.set) {
+        descriptor.set.call(element, text);
+    } else {
+        element.value = text;
+    }
+    element.dispatchEvent(new Event("input", {bubbles: true}));
+    element.dispatchEvent(new Event("change", {bubbles: true}));
+    element.blur();
+};
+
+observe(() => {
+    const elements = fields.map(([by, value]) => findAll(by, value)[0]);
+    if (!elements.every(element => element !== undefined && isVisible(element))) return undefined;
+
+    elements.forEach((element, index) => setValue(element, fields[index][2]));
+    return true;
+}, timeout, done);
+"""
+
+# Installs `window.__networkTracker` once per document (no-op when already there): counts fetch/XHR requests
+# in flight, keeps the last 500 of them as {seq, kind, method, url, done} and counts WebSocket sends.
+# Registered with CDP on new documents for local Chrome, otherwise installed by the first network wait.
+NETWORK_TRACKER = """
+(() => {
+    if (window.__networkTracker) return;
+    const tracker = window.__networkTracker = {
+        pending: 0, seq: 0, requests: [], lastActivity: Date.now(), socketSends: 0, lastSocketSend: 0
+    };
+
+    const absolute = url => {
+        try {
+            return new URL(String(url), location.href).href;
+        } catch (e) {
+            return String(url);
+        }
+    };
+    const begin = (kind, method, url) => {
+        const entry = {
+            seq: ++tracker.seq, kind, method: String(method || "GET").toUpperCase(), url: absolute(url), done: false
+        };
+        tracker.requests.push(entry);
+        if (tracker.requests.length > 500) tracker.requests.shift();
+        tracker.pending++;
+        tracker.lastActivity = Date.now();
+        return entry;
+    };
+    const end = entry => {
+        if (entry.done) return;
+        entry.done = true;
+        tracker.pending = Math.max(tracker.pending - 1, 0);
+        tracker.lastActivity = Date.now();
+    };
+
+    if (window.fetch) {
+        const fetch = window.fetch;
+        window.fetch = function (input, init) {
+            const request = input instanceof Request ? input : null;
+            const method = (init && init.method) || (request && request.method);
+            const entry = begin("fetch", method, request ? request.url : input);
+            try {
+                return fetch.apply(this, arguments).finally(() => end(entry));
+            } catch (e) {
+                end(entry);
+                throw e;
+            }
+        };
+    }
+
+    const open = XMLHttpRequest.prototype.open;
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__tracked = {method, url};
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        const {method, url} = this.__tracked || {};
+        const entry = begin("xhr", method, url);
+        this.addEventListener("loadend", () => end(entry), {once: true});
+        try {
+            return send.apply(this, arguments);
+        } catch (e) {
+            end(entry);
+            throw e;
+        }
+    };
+
+    if (window.WebSocket) {
+        const socketSend = WebSocket.prototype.send;
+        WebSocket.prototype.send = function () {
+            tracker.socketSends++;
+            tracker.lastSocketSend = Date.now();
+            return socketSend.apply(this, arguments);
+        };
+    }
+})();
+"""
+
+# arguments: quiet period (ms), count WebSocket sends as activity, timeout (ms), callback
+# -> {idle, pending: urls still in flight}, idle once nothing was in flight for the quiet period
+WAIT_FOR_NETWORK_IDLE = NETWORK_TRACKER + """
+const [quietMs, includeSockets, timeout, done] = arguments;
+const tracker = window.__networkTracker;
+const start = Date.now();
+
+const check = () => {
+    const now = Date.now();
+    const last = includeSockets ? Math.max(tracker.lastActivity, tracker.lastSocketSend) : tracker.lastActivity;
+    const idle = tracker.pending === 0 && now - last >= quietMs;
+    if (!idle && now - start < timeout) return;
+
+    clearInterval(timer);
+    done({idle, pending: tracker.requests.filter(entry => !entry.done).map(entry => `${entry.method} ${entry.url}`)});
+};
+const timer = setInterval(check, 50);
+check();
+"""
+
+# arguments: url pattern (JavaScript regular expression), sequence number to search after, wait for the response,
+# timeout (ms), callback -> first matching {seq, kind, method, url, done}, null on timeout
+WAIT_FOR_REQUEST = NETWORK_TRACKER + """
+const [pattern, since, completed, timeout, done] = arguments;
+const tracker = window.__networkTracker;
+const regex = new RegExp(pattern);
+// a new document restarts the numbering
+const after = since > tracker.seq ? 0 : since;
+const start = Date.now();
+
+const check = () => {
+    const entry = tracker.requests.find(
+        entry => entry.seq > after && regex.test(entry.url) && (!completed || entry.done)
+    );
+    if (entry === undefined && Date.now() - start < timeout) return;
+
+    clearInterval(timer);
+    done(entry === undefined ? null : entry);
+};
+const timer = setInterval(check, 50);
+check();
+"""
+
+# -> sequence number of the last tracked request, to wait only for requests sent after it
+NETWORK_MARK = NETWORK_TRACKER + """
+return window.__networkTracker.seq;
+"""
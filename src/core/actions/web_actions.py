@@ -1,17 +1,111 @@
-from selenium.common import TimeoutException
+import time
+
+from selenium.common import TimeoutException, WebDriverException, JavascriptException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
-from src.core.actions.base_actions import BaseActions
-from src.data.consts import EXPLICIT_WAIT
+from src.core.actions import scripts
+from src.core.actions.base_actions import BaseActions, handle_broken_steps
+from src.core.actions.locator_compiler import CSS_FILTER, compile_web_locator
+from src.data.consts import EXPLICIT_WAIT, WAIT_ENGINE, NETWORK_QUIET_MS
 from src.utils.assert_utils import soft_assert
 from src.utils.logging_utils import logger
 
 
 class WebActions(BaseActions):
+    # expected conditions the in-page observer can wait for
+    OBSERVER_MODES = {
+        EC.visibility_of_element_located: "visible",
+        EC.invisibility_of_element_located: "invisible",
+        EC.presence_of_element_located: "present",
+        EC.presence_of_all_elements_located: "present_all",
+    }
+    wait_engine = WAIT_ENGINE
+    compile_locators = True
+
     def __init__(self, driver):
         super().__init__(driver)
+        self._script_timeout = None
+
+    @classmethod
+    def configure(cls, wait_engine=None):
+        """`polling` re-checks the condition every 0.5s, `observer` waits in the page on DOM mutations."""
+        cls.wait_engine = wait_engine or WAIT_ENGINE
+
+    def _resolve_locator(self, locator: tuple[str, str]) -> tuple[str, str]:
+        """Send XPath locators having a CSS equivalent as CSS (plus an in-page text filter when they match text)."""
+        return compile_web_locator(locator) if self.compile_locators else tuple(locator)
+
+    def _wait_until(self, locator: tuple[str, str], cond=BaseActions.DEFAULT_CONDITION, timeout=EXPLICIT_WAIT):
+        mode = self.OBSERVER_MODES.get(cond)
+        resolved = self._resolve_locator(locator)
+
+        if mode is None:
+            # any other expected condition needs a locator Selenium understands
+            return self._until(cond(tuple(locator) if resolved[0] == CSS_FILTER else resolved), timeout)
+
+        if self.wait_engine == "observer":
+            start = time.time()
+            try:
+                return self._observe(resolved, mode, timeout)
+
+            except TimeoutException:
+                raise
+
+            except WebDriverException as e:
+                # the script is interrupted by a navigation (or cannot evaluate the locator), poll the remaining time
+                logger.debug(f"- Observer wait interrupted for {locator}: {type(e).__name__}, fall back to polling")
+                timeout = max(timeout - (time.time() - start), 0)
+
+        if resolved[0] == CSS_FILTER:
+            return self._until(lambda _: self._driver.execute_script(scripts.CHECK_ELEMENT, *resolved, mode), timeout)
+
+        return self._until(cond(resolved), timeout)
+
+    def _wait_locators(self, locators: list[tuple[str, str]], require_all: bool, displayed: bool, timeout) -> dict:
+        if self.wait_engine != "observer" or not locators:
+            return super()._wait_locators(locators, require_all, displayed, timeout)
+
+        resolved = [self._resolve_locator(locator) for locator in locators]
+        start = time.time()
+        try:
+            self._ensure_script_timeout(timeout)
+            states = self._driver.execute_async_script(
+                scripts.WAIT_FOR_LOCATORS, resolved, require_all, displayed, int(timeout * 1000)
+            )
+
+        except WebDriverException as e:
+            logger.debug(f"- Observer wait interrupted for {locators}: {type(e).__name__}, fall back to polling")
+            states = {"error": type(e).__name__}
+
+        if isinstance(states, list):
+            return dict(zip(locators, states))
+
+        if isinstance(states, dict):
+            logger.debug(f"- Observer cannot evaluate {locators}: {states.get('error')}, fall back to polling")
+
+        # timed out (a last poll gives the states) or interrupted (polled for the time left)
+        return super()._wait_locators(locators, require_all, displayed, max(timeout - (time.time() - start), 0))
+
+    def _ensure_script_timeout(self, timeout):
+        """Keep the async script timeout above the longest in-page wait."""
+        if self._script_timeout is None or self._script_timeout < timeout + 5:
+            self._script_timeout = timeout + 5
+            self._driver.set_script_timeout(self._script_timeout)
+
+    def _observe(self, locator: tuple[str, str], mode: str, timeout):
+        """Wait in a single async script call, resolved by the page as soon as the condition is met."""
+        self._ensure_script_timeout(timeout)
+        result = self._driver.execute_async_script(scripts.WAIT_FOR_ELEMENT, *locator, mode, int(timeout * 1000))
+
+        if isinstance(result, dict) and "error" in result:
+            raise JavascriptException(result["error"])
+
+        if result is None:
+            raise TimeoutException(f"{mode!r} not met for {locator} within {timeout}s")
+
+        return result
 
     # ------- ACTIONS ------ #
     def goto(self, url):
@@ -34,6 +128,118 @@ class WebActions(BaseActions):
 
         return self._driver.current_url
 
+    def wait_for_network_idle(self, quiet_ms=NETWORK_QUIET_MS, timeout=EXPLICIT_WAIT, include_sockets=False) -> bool:
+        """
+        Wait until no fetch/XHR request has been in flight for `quiet_ms`, return whether the page got idle in time.
+        WebSocket sends only count as activity with `include_sockets`, streamed prices would never let it settle.
+        """
+        result = self._network_wait(scripts.WAIT_FOR_NETWORK_IDLE, quiet_ms, include_sockets, timeout=timeout)
+        if not result or not result.get("idle"):
+            logger.debug(f"- Network not idle after {timeout}s, in flight: {(result or {}).get('pending')}")
+            return False
+
+        return True
+
+    def mark_network(self) -> int:
+        """Sequence number of the last tracked request, pass it as `since` to only wait for the next ones."""
+        return self._driver.execute_script(scripts.NETWORK_MARK)
+
+    def wait_for_request(self, url_pattern: str, timeout=EXPLICIT_WAIT, since=0, completed=True) -> dict | None:
+        """
+        Wait for a fetch/XHR request whose URL matches `url_pattern` (JavaScript regular expression),
+        answered unless `completed` is False. Return it as {seq, kind, method, url, done}, None on timeout.
+        """
+        request = self._network_wait(scripts.WAIT_FOR_REQUEST, url_pattern, since, completed, timeout=timeout)
+        if request is None:
+            logger.debug(f"- No request matching {url_pattern!r} after {timeout}s")
+
+        return request
+
+    def _network_wait(self, script: str, *args, timeout):
+        """Run a network wait script, once more on the new document when a navigation interrupts it."""
+        start = time.time()
+        for attempt in range(2):
+            remaining = max(timeout - (time.time() - start), 0)
+            self._ensure_script_timeout(remaining)
+            try:
+                return self._driver.execute_async_script(script, *args, int(remaining * 1000))
+
+            except TimeoutException:
+                raise
+
+            except WebDriverException as e:
+                if attempt:
+                    raise
+
+                logger.debug(f"- Network wait interrupted: {type(e).__name__}, wait on the current document")
+
+        return None
+
+    def get_session_state(self) -> dict:
+        """Capture cookies and web storage of the current page so the session can be restored later."""
+        storage = self._driver.execute_script(
+            "const dump = s => { const o = {}; for (let i = 0; i < s.length; i++) { o[s.key(i)] = s.getItem(s.key(i)); } return o; };"
+            "return {local: dump(window.localStorage), session: dump(window.sessionStorage)};"
+        )
+        return dict(cookies=self._driver.get_cookies(), **storage)
+
+    def clear_session_state(self):
+        """Drop cookies and web storage of the current origin."""
+        self._driver.delete_all_cookies()
+        self._driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+
+    def restore_session_state(self, state: dict, url: str):
+        """
+        Inject a captured session into the current origin, then navigate to the url.
+        The browser must already be on the application origin.
+        """
+        for cookie in state.get("cookies", []):
+            if cookie.get("expiry", float("inf")) > time.time():
+                self._driver.add_cookie(cookie)
+
+        self._driver.execute_script(
+            "const [local, session] = arguments;"
+            "Object.entries(local).forEach(([k, v]) => window.localStorage.setItem(k, v));"
+            "Object.entries(session).forEach(([k, v]) => window.sessionStorage.setItem(k, v));",
+            state.get("local", {}), state.get("session", {})
+        )
+        self.goto(url)
+
+    def fill_form(self, fields: dict[tuple[str, str], str], typing=False, timeout=EXPLICIT_WAIT):
+        """
+        Fill many inputs at once: {locator: value}, in order.
+        Values are set in a single script call (native value setter + input/change events, so React sees them),
+        `typing` sends real keystrokes field by field instead, for tests exercising the typing itself.
+        """
+        if not typing and self._set_form_values(fields, timeout):
+            return
+
+        for locator, value in fields.items():
+            self.send_keys(locator, str(value), timeout)
+
+    @handle_broken_steps
+    def _set_form_values(self, fields: dict[tuple[str, str], str], timeout=EXPLICIT_WAIT) -> bool:
+        """Set the values with FILL_FORM, False when the script was interrupted and the fields must be typed."""
+        payload = [[*self._resolve_locator(locator), str(value)] for locator, value in fields.items()]
+        try:
+            self._ensure_script_timeout(timeout)
+            filled = self._driver.execute_async_script(scripts.FILL_FORM, payload, int(timeout * 1000))
+
+        except TimeoutException:
+            raise
+
+        except WebDriverException as e:
+            logger.debug(f"- Fast form fill interrupted: {type(e).__name__}, type the values instead")
+            return False
+
+        if isinstance(filled, dict):
+            raise JavascriptException(filled.get("error"))
+
+        if filled is not True:
+            raise Exception(f"Form fields {list(fields)} not all displayed after {timeout}s")
+
+        return True
+
     def right_click(
             self, locator: tuple[str, str], timeout=EXPLICIT_WAIT, retries=1,
             cond=BaseActions.DEFAULT_CONDITION
@@ -50,6 +256,11 @@ class WebActions(BaseActions):
         element = self._find_element(locator, timeout, retries, cond)
         element.send_keys(Keys.ENTER)
 
+    def _read_elements_once(self, locators, properties, all_matches) -> list:
+        """Read every locator and property in a single script round trip."""
+        resolved = [self._resolve_locator(locator) for locator in locators]
+        return self._driver.execute_script(scripts.READ_ELEMENTS, resolved, properties, all_matches)
+
     # ------- VERIFY ------ #
 
     def verify_url(self, expected_url: str, timeout: int = EXPLICIT_WAIT, retries: int = 1):
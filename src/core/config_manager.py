@@ -52,6 +52,18 @@ class ClientConfig:
     def mobile_config(self):
         return DotDict(self._config.mobile)
 
+    @property
+    def android_devices(self) -> list:
+        """
+        Android devices to shard the suite across.
+        `android_devices` accepts udid strings or mappings with an udid and optional fixed ports,
+        a single `android_udid` is still supported.
+        """
+        mobile = self.mobile_config
+        devices = mobile.get("android_devices") or mobile.get("android_udid") or []
+        devices = devices if isinstance(devices, list) else [devices]
+        return [DotDict(device) if isinstance(device, dict) else DotDict(udid=device) for device in devices]
+
 
 class ConfigManager:
     config: Dict[str, Any] = {}
@@ -125,6 +137,16 @@ class ConfigManager:
 
         return cls._client_config.mobile_config
 
+    @classmethod
+    def get_android_devices(cls) -> list:
+        if not cls._client_config:
+            if not cls._loaded or "client" not in cls.config:
+                raise ValueError("Client configuration not initialized. Call load_config() first.")
+
+            cls._client_config = cls.get_client_config(cls.config.client)
+
+        return cls._client_config.android_devices
+
     @classmethod
     def set_value(cls, key: str, value):
         cls.config[key] = value
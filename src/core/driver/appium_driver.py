@@ -1,41 +1,85 @@
-import subprocess
-
 from appium import webdriver
 from appium.options.android import UiAutomator2Options
-from appium.webdriver.appium_service import AppiumService
 from selenium.common import WebDriverException
 
 from src.core.config_manager import Config
+from src.core.driver.appium_service import AppiumServiceManager
+from src.core.driver.device_scheduler import DeviceScheduler
 from src.data.project_info import DriverList
 from src.utils.logging_utils import logger
+from src.utils.profiling_utils import CommandProfiler
 
 
 class AppiumDriver:
-    _appium_service = None
+    reuse_session = False
+    clear_app_data = False
+
+    _idle_driver = None  # session parked between tests when reuse_session is on
 
     @classmethod
-    def __start_appium_service(cls, host="localhost", port=4723):
+    def configure(cls, reuse_session=False, clear_app_data=False):
+        cls.reuse_session = reuse_session
+        cls.clear_app_data = clear_app_data
 
-        kill_command = f"lsof -ti :{port} | xargs kill -9"
+    @classmethod
+    def acquire_android_driver(cls) -> webdriver.Remote:
+        """Hand out the parked session when reuse is on, otherwise (or when it is gone) start a new one."""
+        driver, cls._idle_driver = cls._idle_driver, None
 
-        subprocess.run(kill_command, shell=True, check=True)
+        if driver is not None:
+            try:
+                _ = driver.current_package
+                DriverList.all_drivers["android"] = driver
+                logger.debug(f"- Reuse android session: {driver.session_id}")
+                return driver
 
-        cls._appium_service = AppiumService()
-        args = [
-            "-pa", "/wd/hub",
-            "--address", host,
-            "--port", str(port),
-        ]
+            except WebDriverException as e:
+                logger.warning(f"- Parked android session is not usable anymore: {type(e).__name__}")
+                cls._quit_silently(driver)
 
-        logger.debug("- Starting appium service...")
-        cls._appium_service.start(args=args, timeout_ms=30000)
-        logger.info("- Appium service started !")
+        return cls.init_android_driver()
 
     @classmethod
-    def init_android_driver(cls, host="http://localhost", port=4723) -> webdriver.Remote:
+    def release_android_driver(cls, driver, failed=False):
+        """
+        Park the session for the next test after restarting the app,
+        quit it when reuse is off, the test failed (its app or driver state may be wedged) or the reset fails.
+        """
+        if DriverList.all_drivers.get("android") is driver:
+            DriverList.all_drivers["android"] = None
+
+        if driver is None:
+            return
+
+        if not cls.reuse_session or failed:
+            cls._quit_silently(driver)
+            return
+
+        try:
+            cls.reset_app(driver)
+            cls._idle_driver = driver
+
+        except WebDriverException as e:
+            logger.warning(f"- Failed to reset app, start a new session for the next test: {type(e).__name__}")
+            cls._quit_silently(driver)
+
+    @classmethod
+    def reset_app(cls, driver):
+        """Restart the app under test inside the same session, optionally wiping its data."""
+        package = Config.get_mobile_config().android_package
+
+        driver.terminate_app(package)
+        if cls.clear_app_data:
+            driver.execute_script("mobile: clearApp", {"appId": package})
+        driver.activate_app(package)
+
+    @classmethod
+    def init_android_driver(cls, host="localhost") -> webdriver.Remote:
         mobile_config = Config.get_mobile_config()
+        device = DeviceScheduler.acquire()  # leased for the whole run of this process
+
         options = UiAutomator2Options()
-        options.udid = mobile_config.android_udid  # "R5CWA20BQ9P"
+        options.udid = device.udid  # "R5CWA20BQ9P"
         options.app_package = mobile_config.android_package  # "com.aquariux.wt.sit.lirunex"
         options.app_activity = ".MainActivity"
         options.app_wait_activity = ".MainActivity"
@@ -47,12 +91,14 @@ class AppiumDriver:
         options.full_reset = False
         options.new_command_timeout = 300
         options.set_capability("appium:shouldTerminateApp", True)
+        options.set_capability("appium:systemPort", device.system_port)
+        options.set_capability("appium:mjpegServerPort", device.mjpeg_server_port)
 
-        cls.__start_appium_service()
+        server_url = AppiumServiceManager.ensure_running(host, device.appium_port)
 
         try:
             logger.debug("- Init android driver...")
-            driver = webdriver.Remote(f"{host}:{port}/wd/hub", options=options)
+            driver = CommandProfiler.attach(webdriver.Remote(server_url, options=options))
 
             DriverList.all_drivers["android"] = driver
             logger.info("- Android driver init !")
@@ -63,14 +109,25 @@ class AppiumDriver:
 
     @classmethod
     def quit_android_driver(cls):
+        """Quit the driver session, the appium service keeps running for the next session."""
         if DriverList.all_drivers.get("android", None):
             DriverList.all_drivers["android"].quit()
             DriverList.all_drivers["android"] = None
 
-        cls.stop_appium_service()
+    @classmethod
+    def quit_idle_driver(cls):
+        driver, cls._idle_driver = cls._idle_driver, None
+        if driver is not None:
+            cls._quit_silently(driver)
 
     @classmethod
     def stop_appium_service(cls):
-        if cls._appium_service:
-            cls._appium_service.stop()
-            cls._appium_service = None
+        AppiumServiceManager.stop_all()
+
+    @staticmethod
+    def _quit_silently(driver):
+        try:
+            driver.quit()
+
+        except Exception as e:
+            logger.debug(f"- Ignore error while quitting android driver: {type(e).__name__}")
@@ -0,0 +1,78 @@
+import json
+import subprocess
+import urllib.error
+import urllib.request
+
+from appium.webdriver.appium_service import AppiumService
+
+from src.utils.logging_utils import logger
+
+BASE_PATH = "/wd/hub"
+
+
+class AppiumServiceManager:
+    """
+    Long-lived Appium servers, one per port, shared by every driver session of the test run.
+    A server is health-checked over /status before each session and only (re)started when it is not answering.
+    """
+    _services = {}  # port -> AppiumService started by this process
+
+    @classmethod
+    def get_url(cls, host="localhost", port=4723) -> str:
+        return f"http://{host}:{port}{BASE_PATH}"
+
+    @classmethod
+    def is_healthy(cls, host="localhost", port=4723, timeout=2) -> bool:
+        """Check the server answers /status and reports itself ready."""
+        try:
+            with urllib.request.urlopen(f"{cls.get_url(host, port)}/status", timeout=timeout) as response:
+                status = json.loads(response.read() or b"{}")
+
+        except (urllib.error.URLError, OSError, ValueError):
+            return False
+
+        # older servers or a proxy error page may not answer a {"value": {...}} object
+        value = status.get("value", {}) if isinstance(status, dict) else None
+        if not isinstance(value, dict):
+            return False
+
+        return value.get("ready", True) is not False
+
+    @classmethod
+    def ensure_running(cls, host="localhost", port=4723) -> str:
+        """Return the url of a healthy Appium server on the port, starting one if needed."""
+        if not cls.is_healthy(host, port):
+            cls._start(host, port)
+
+        return cls.get_url(host, port)
+
+    @classmethod
+    def stop(cls, port=4723):
+        service = cls._services.pop(port, None)
+        if service:
+            service.stop()
+            logger.debug(f"- Appium service on port {port} stopped")
+
+    @classmethod
+    def stop_all(cls):
+        for port in list(cls._services):
+            cls.stop(port)
+
+    @classmethod
+    def _start(cls, host, port):
+        cls.stop(port)
+
+        # a process still holding the port is not answering /status, free the port
+        subprocess.run(f"lsof -ti :{port} | xargs kill -9", shell=True, check=False, capture_output=True)
+
+        service = AppiumService()
+        args = [
+            "-pa", BASE_PATH,
+            "--address", host,
+            "--port", str(port),
+        ]
+
+        logger.debug(f"- Starting appium service on port {port}...")
+        service.start(args=args, timeout_ms=30000)
+        cls._services[port] = service
+        logger.info("- Appium service started !")
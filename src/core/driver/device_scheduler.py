@@ -0,0 +1,159 @@
+import os
+import socket
+import time
+
+from src.core.config_manager import Config
+from src.data.consts import APPIUM_BASE_PORT, SYSTEM_BASE_PORT, MJPEG_BASE_PORT, DEVICE_LEASE_DIR, DEVICE_LEASE_WAIT
+from src.utils import DotDict
+from src.utils.logging_utils import logger
+
+
+class PortAllocator:
+    """
+    Host ports of each configured device: Appium server, UiAutomator2 systemPort and mjpegServerPort.
+    Ports come from the device position in the config so every process allocates the same ones,
+    a port taken by another program is skipped by steps of the device count to stay unique per device.
+    """
+
+    @classmethod
+    def allocate(cls, device: DotDict, index: int, device_count: int) -> DotDict:
+        return DotDict(
+            udid=device.udid,
+            appium_port=device.get("appium_port") or APPIUM_BASE_PORT + index,
+            system_port=device.get("system_port") or cls._find_free_port(SYSTEM_BASE_PORT + index, device_count),
+            mjpeg_server_port=device.get("mjpeg_server_port") or cls._find_free_port(MJPEG_BASE_PORT + index, device_count),
+        )
+
+    @classmethod
+    def _find_free_port(cls, port: int, step: int, attempts=10) -> int:
+        for candidate in range(port, port + step * attempts, max(step, 1)):
+            if cls.is_port_free(candidate):
+                return candidate
+
+        raise RuntimeError(f"No free port found from {port} (step {step})")
+
+    @staticmethod
+    def is_port_free(port: int, host="127.0.0.1") -> bool:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            try:
+                sock.bind((host, port))
+                return True
+
+            except OSError:
+                return False
+
+
+class DeviceScheduler:
+    """
+    Hand out configured Android devices to test processes.
+    A device is leased through a lock file holding the owner pid, so parallel xdist workers never share one,
+    run with `-n <number of devices>` to use every device. Leases of dead processes are taken over.
+    """
+    lease_dir = DEVICE_LEASE_DIR
+    _device = None
+
+    @classmethod
+    def current(cls) -> DotDict | None:
+        return cls._device
+
+    @classmethod
+    def acquire(cls, devices: list = None, timeout=DEVICE_LEASE_WAIT) -> DotDict:
+        """
+        Lease a free device (kept until `release`) and return its udid and allocated ports.
+        Devices default to the ones of the client config.
+        """
+        if cls._device:
+            return cls._device
+
+        devices = devices if devices is not None else Config.get_android_devices()
+        if not devices:
+            raise ValueError("No android device configured (mobile.android_devices / mobile.android_udid)")
+
+        os.makedirs(cls.lease_dir, exist_ok=True)
+        deadline = time.time() + timeout
+
+        while True:
+            # only free devices are tried, in config order so each device keeps its ports
+            free = set(cls.free_devices(devices))
+            for index, device in enumerate(devices):
+                if device.udid in free and cls._try_lease(device.udid):
+                    cls._device = PortAllocator.allocate(device, index, len(devices))
+                    logger.info(f"- Leased android device {device.udid!r}: {dict(cls._device)}")
+                    return cls._device
+
+            if time.time() > deadline:
+                raise TimeoutError(f"No free android device after {timeout}s, all {len(devices)} device(s) are leased")
+
+            time.sleep(1)
+
+    @classmethod
+    def release(cls):
+        if not cls._device:
+            return
+
+        try:
+            os.remove(cls._lease_path(cls._device.udid))
+
+        except OSError:
+            pass
+
+        logger.debug(f"- Released android device {cls._device.udid!r}")
+        cls._device = None
+
+    @classmethod
+    def free_devices(cls, devices: list = None) -> list:
+        """Udids of the devices nobody holds a lease on."""
+        devices = devices if devices is not None else Config.get_android_devices()
+        return [device.udid for device in devices if cls._lease_owner(device.udid) is None]
+
+    @classmethod
+    def _try_lease(cls, udid) -> bool:
+        if os.path.exists(cls._lease_path(udid)) and cls._lease_owner(udid) is None:
+            # owner died without releasing, re-check right before removing to keep the race window small
+            cls._remove_stale_lease(udid)
+
+        try:
+            fd = os.open(cls._lease_path(udid), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+
+        except FileExistsError:
+            return False
+
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+
+        return True
+
+    @classmethod
+    def _lease_owner(cls, udid) -> int | None:
+        """Pid of the live process holding the device, None when the device is free."""
+        try:
+            with open(cls._lease_path(udid), "r") as f:
+                pid = int(f.read().strip() or 0)
+
+        except (OSError, ValueError):
+            return None
+
+        try:
+            os.kill(pid, 0)
+            return pid
+
+        except ProcessLookupError:
+            return None
+
+        except PermissionError:
+            return pid  # alive, owned by another user
+
+    @classmethod
+    def _remove_stale_lease(cls, udid):
+        if cls._lease_owner(udid) is not None:
+            return
+
+        try:
+            os.remove(cls._lease_path(udid))
+
+        except OSError:
+            pass
+
+    @classmethod
+    def _lease_path(cls, udid):
+        return cls.lease_dir / f"{udid}.lock"
@@ -1,12 +1,27 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from src.core.config_manager import Config
 from src.core.driver.appium_driver import AppiumDriver
+from src.core.driver.device_scheduler import DeviceScheduler
+from src.core.driver.driver_pool import WebDriverPool
 from src.core.driver.web_driver import WebDriver
+from src.data.project_info import DriverList
 from src.utils.logging_utils import logger
 
 
 class DriverManager:
+    # look-ahead launcher: one spare browser starting on a background thread while the current test runs
+    prewarm = True
+    _spare = None  # (launch options, future of the spare driver)
+    _spare_executor = None
+    _spare_lock = threading.Lock()
+    _pool_warming = None  # future of the warm browsers being launched for the pool
+
+    @classmethod
+    def configure(cls, prewarm=True):
+        cls.prewarm = bool(prewarm)
 
     @classmethod
     def get_driver(cls, platform=Config.get_value("platform") or "web", **kwargs) -> Any:
@@ -15,11 +30,11 @@ class DriverManager:
         """
         match platform.lower():
             case "web":
-                return WebDriver.init_driver(
-                    browser=kwargs.get("browser", Config.get_value("browser")),
-                    headless=kwargs.get("headless", Config.get_value("headless")),
-                    grid=kwargs.get("grid", Config.get_value("grid")),
-                )
+                options = cls._web_options(**kwargs)
+                driver = cls.take_spare(**options) or WebDriver.create_driver(**options)
+                DriverList.all_drivers["web"] = driver
+                cls.prepare_spare(**options)
+                return driver
 
             case "ios":
                 logger.warning("iOS driver initialization not implemented yet")
@@ -31,6 +46,40 @@ class DriverManager:
             case _:
                 raise ValueError(f"Invalid platform: {platform}")
 
+    @classmethod
+    def acquire_driver(cls, platform=Config.get_value("platform") or "web", **kwargs) -> Any:
+        """
+        Get a driver for a single test, reusing a warm one where the platform supports it.
+        """
+        match platform.lower():
+            case "web":
+                options = cls._web_options(**kwargs)
+                driver = WebDriverPool.acquire(**options, launcher=cls._launch_web)
+                cls.prepare_spare(**options)
+                return driver
+
+            case "android":
+                return AppiumDriver.acquire_android_driver()
+
+            case _:
+                return cls.get_driver(platform, **kwargs)
+
+    @classmethod
+    def release_driver(cls, platform=Config.get_value("platform") or "web", driver=None, failed=False):
+        """
+        Hand back a driver obtained with `acquire_driver` once the test is done.
+        """
+        match platform.lower():
+            case "web":
+                WebDriverPool.release(driver, failed=failed)
+                cls.prepare_pool()  # replace a recycled browser
+
+            case "android":
+                AppiumDriver.release_android_driver(driver, failed=failed)
+
+            case _:
+                cls.quit_driver(platform)
+
     @classmethod
     def quit_driver(cls, platform=Config.get_value("platform") or "web"):
         match platform.lower():
@@ -46,3 +95,121 @@ class DriverManager:
             case _:
                 raise ValueError(f"Invalid platform: {platform}")
 
+    @classmethod
+    def shutdown(cls, platform=Config.get_value("platform") or "web"):
+        """
+        Release everything kept alive across tests (warm browsers, appium services) at the end of the run.
+        """
+        cls.quit_driver(platform)
+
+        match platform.lower():
+            case "web":
+                cls.discard_spare()
+                WebDriverPool.shutdown()
+
+            case "android":
+                AppiumDriver.quit_idle_driver()
+                AppiumDriver.stop_appium_service()
+                DeviceScheduler.release()
+
+    @classmethod
+    def prepare_spare(cls, **kwargs):
+        """Start launching the browser of the next test in the background, unless one is already on its way."""
+        if not cls.prewarm:
+            return
+
+        options = cls._web_options(**kwargs)
+        with cls._spare_lock:
+            if cls._spare is not None:
+                return
+
+            if cls._spare_executor is None:
+                cls._spare_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spare-driver")
+
+            logger.debug("- Prepare spare browser in background")
+            cls._spare = (options, cls._spare_executor.submit(cls._create_spare, **options))
+
+    @classmethod
+    def prepare_pool(cls, **kwargs):
+        """
+        Launch browsers in the background until the pool holds `WebDriverPool.size` warm ones,
+        after the spare on the same launcher thread (a pool of one is covered by the spare).
+        """
+        if not cls.prewarm or WebDriverPool.size <= 1:
+            return
+
+        options = cls._web_options(**kwargs)
+        with cls._spare_lock:
+            if cls._pool_warming is not None and not cls._pool_warming.done():
+                return
+
+            if cls._spare_executor is None:
+                cls._spare_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="spare-driver")
+
+            logger.debug(f"- Prepare up to {WebDriverPool.size} warm browsers in background")
+            cls._pool_warming = cls._spare_executor.submit(WebDriverPool.warm, **options)
+
+    @classmethod
+    def take_spare(cls, **kwargs):
+        """Return the spare browser (waiting for it to finish starting), or None when there is no usable one."""
+        options = cls._web_options(**kwargs)
+        with cls._spare_lock:
+            spare, cls._spare = cls._spare, None
+
+        if spare is None:
+            return None
+
+        spare_options, future = spare
+        if spare_options != options:
+            cls._quit_spare(future)
+            return None
+
+        try:
+            driver = future.result()
+
+        except Exception as e:
+            logger.warning(f"- Spare browser failed to start: {type(e).__name__}")
+            return None
+
+        logger.debug(f"- Use spare browser (session: {driver.session_id})")
+        return driver
+
+    @classmethod
+    def discard_spare(cls):
+        """Quit the spare browser and stop the background launcher."""
+        with cls._spare_lock:
+            spare, cls._spare = cls._spare, None
+            executor, cls._spare_executor = cls._spare_executor, None
+            cls._pool_warming = None
+
+        if spare is not None:
+            cls._quit_spare(spare[1])
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @classmethod
+    def _launch_web(cls, browser="chrome", headless=False, grid=False):
+        return cls.take_spare(browser=browser, headless=headless, grid=grid) or WebDriver.create_driver(browser, headless, grid)
+
+    @staticmethod
+    def _create_spare(browser, headless, grid):
+        driver = WebDriver.create_driver(browser, headless, grid)
+        driver.get(Config.get_url_site())
+        return driver
+
+    @staticmethod
+    def _quit_spare(future):
+        try:
+            future.result().quit()
+
+        except Exception as e:
+            logger.debug(f"- Ignore error while quitting spare browser: {type(e).__name__}")
+
+    @staticmethod
+    def _web_options(**kwargs) -> dict:
+        return dict(
+            browser=kwargs.get("browser", Config.get_value("browser")),
+            headless=kwargs.get("headless", Config.get_value("headless")),
+            grid=kwargs.get("grid", Config.get_value("grid")),
+        )
@@ -0,0 +1,130 @@
+from src.core.config_manager import Config
+from src.core.driver.web_driver import WebDriver
+from src.data.consts import DRIVER_POOL_SIZE, DRIVER_MAX_USES
+from src.data.project_info import DriverList
+from src.utils.logging_utils import logger
+
+
+class WebDriverPool:
+    """
+    Keep warm browsers between tests instead of launching a fresh one per test.
+    Up to `size` idle browsers are launched ahead of the tests (see `DriverManager.prepare_pool`).
+    A released browser is reset (cookies, web storage, extra windows) and parked on the member site,
+    it is recycled after `max_uses` tests or as soon as the test or the reset fails.
+    """
+    size = DRIVER_POOL_SIZE
+    max_uses = DRIVER_MAX_USES
+
+    _idle = []
+    _uses = {}
+
+    @classmethod
+    def configure(cls, size=None, max_uses=None):
+        cls.size = max(1, int(size or DRIVER_POOL_SIZE))
+        cls.max_uses = max(1, int(max_uses or DRIVER_MAX_USES))
+
+    @classmethod
+    def acquire(cls, browser="chrome", headless=False, grid=False, launcher=None):
+        """
+        Hand out a warm browser (or launch one) and register it as the active web driver.
+        `launcher` replaces `WebDriver.create_driver` to start the browser when no warm one is left.
+        """
+        driver = None
+
+        while cls._idle:
+            candidate = cls._idle.pop()
+            if cls._is_alive(candidate):
+                driver = candidate
+                logger.debug(f"- Reuse warm browser (session: {driver.session_id}, uses: {cls._uses[driver.session_id]})")
+                break
+
+            cls._discard(candidate)
+
+        if driver is None:
+            driver = cls._launch(browser, headless, grid, launcher)
+
+        DriverList.all_drivers["web"] = driver
+        return driver
+
+    @classmethod
+    def release(cls, driver, failed=False):
+        """Return a browser to the pool, or quit it when it should be recycled."""
+        if DriverList.all_drivers.get("web") is driver:
+            DriverList.all_drivers["web"] = None
+
+        if driver is None:
+            return
+
+        cls._uses[driver.session_id] = cls._uses.get(driver.session_id, 0) + 1
+
+        if failed or cls._uses[driver.session_id] >= cls.max_uses or len(cls._idle) >= cls.size:
+            cls._discard(driver)
+            return
+
+        try:
+            cls.reset(driver)
+
+        except Exception as e:
+            # a dead browser may fail with connection errors rather than WebDriverException
+            logger.warning(f"- Failed to reset browser, recycle it: {type(e).__name__}")
+            cls._discard(driver)
+            return
+
+        cls._idle.append(driver)
+
+    @classmethod
+    def reset(cls, driver):
+        """Clear per-test browser state and navigate back to the member site."""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.get(Config.get_url_site())
+
+    @classmethod
+    def warm(cls, browser="chrome", headless=False, grid=False):
+        """Launch browsers until the pool holds `size` idle ones, run in the background by DriverManager."""
+        while len(cls._idle) < cls.size:
+            try:
+                cls._idle.append(cls._launch(browser, headless, grid))
+
+            except Exception as e:
+                logger.warning(f"- Failed to launch a warm browser: {type(e).__name__}")
+                return
+
+    @classmethod
+    def shutdown(cls):
+        """Quit every idle browser."""
+        while cls._idle:
+            cls._discard(cls._idle.pop())
+
+    @classmethod
+    def _launch(cls, browser, headless, grid, launcher=None):
+        logger.debug("- Launch new browser for pool")
+        driver = (launcher or WebDriver.create_driver)(browser, headless, grid)
+        if not driver.current_url.startswith(Config.get_url_site()):
+            driver.get(Config.get_url_site())
+        cls._uses[driver.session_id] = 0
+        return driver
+
+    @classmethod
+    def _discard(cls, driver):
+        cls._uses.pop(driver.session_id, None)
+        try:
+            driver.quit()
+
+        except Exception as e:
+            logger.debug(f"- Ignore error while quitting browser: {type(e).__name__}")
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            _ = driver.current_url
+            return True
+
+        except Exception:
+            return False
@@ -1,8 +1,10 @@
 from selenium import webdriver
 from selenium.webdriver import ChromeOptions, FirefoxOptions, SafariOptions
 
+from src.core.actions import scripts
 from src.data.consts import GRID_SERVER
 from src.data.project_info import DriverList
+from src.utils.profiling_utils import CommandProfiler
 
 
 class WebDriver:
@@ -10,6 +12,13 @@ class WebDriver:
 
     @classmethod
     def init_driver(cls, browser="chrome", headless=False, grid=False):
+        driver = cls.create_driver(browser, headless, grid)
+        DriverList.all_drivers["web"] = driver
+        return driver
+
+    @classmethod
+    def create_driver(cls, browser="chrome", headless=False, grid=False):
+        """Launch a new browser without registering it as the active web driver."""
         match browser.lower():
             case "chrome":
                 options = ChromeOptions()
@@ -28,6 +37,8 @@ class WebDriver:
                     driver = webdriver.Remote(GRID_SERVER, options=options)
                 else:
                     driver = webdriver.Chrome(options=options)
+                    # track requests from the first one of every document, other browsers install it on first wait
+                    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": scripts.NETWORK_TRACKER})
 
             case "firefox":
                 options = FirefoxOptions()
@@ -58,9 +69,8 @@ class WebDriver:
         # Move browser to second display (assuming 1920x1080 resolution for main display)
         # This positions the window at x=2000 (past the first display) and y=0 (top of the screen)
         driver.set_window_position(2000, 0)
-        
-        DriverList.all_drivers["web"] = driver
-        return driver
+
+        return CommandProfiler.attach(driver)
 
     @classmethod
     def quit(cls):
@@ -0,0 +1,75 @@
+import json
+import os
+import time
+
+from src.core.config_manager import Config
+from src.data.consts import SESSION_CACHE_DIR, SESSION_CACHE_TTL
+from src.data.enums import Server, AccountType
+from src.utils.logging_utils import logger
+
+
+class SessionCache:
+    """
+    Disk cache of authenticated browser sessions (cookies + web storage) keyed by env, client, server and account.
+    A session is trusted for `ttl` seconds after it was captured, a `ttl` of 0 disables the cache.
+    """
+    ttl = SESSION_CACHE_TTL
+
+    @classmethod
+    def configure(cls, ttl=None):
+        cls.ttl = SESSION_CACHE_TTL if ttl is None else max(0, int(ttl))
+
+    @classmethod
+    def enabled(cls) -> bool:
+        return cls.ttl > 0
+
+    @classmethod
+    def key(cls, server: Server, account_type: AccountType) -> str:
+        return "_".join([Config.get_value("env"), Config.get_value("client"), server, account_type])
+
+    @classmethod
+    def load(cls, key: str) -> dict | None:
+        """Return the cached session state, or None when it is missing, unreadable or expired."""
+        if not cls.enabled():
+            return None
+
+        try:
+            with open(cls._path(key), "r", encoding="utf-8") as f:
+                session = json.load(f)
+
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - session.get("created_at", 0) > cls.ttl:
+            logger.debug(f"- Cached session {key!r} expired")
+            cls.invalidate(key)
+            return None
+
+        return session["state"]
+
+    @classmethod
+    def save(cls, key: str, state: dict):
+        if not cls.enabled():
+            return
+
+        os.makedirs(SESSION_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cls._path(key)}.{os.getpid()}.tmp"
+
+        # write then rename, parallel workers never read a half written file
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(dict(created_at=time.time(), state=state), f)
+        os.replace(tmp_path, cls._path(key))
+
+        logger.debug(f"- Cached session {key!r}")
+
+    @classmethod
+    def invalidate(cls, key: str):
+        try:
+            os.remove(cls._path(key))
+
+        except OSError:
+            pass
+
+    @staticmethod
+    def _path(key: str):
+        return SESSION_CACHE_DIR / f"{key}.json"
@@ -13,3 +13,31 @@ EXPLICIT_WAIT = 10
 IMPLICIT_WAIT = 0
 PAGE_LOAD_WAIT = 30
 SHORT_WAIT = 5
+WAIT_ENGINE = "polling"  # web waits: "polling" (WebDriverWait) or "observer" (in-page MutationObserver)
+NETWORK_QUIET_MS = 500  # milliseconds without any request in flight for the page to count as network idle
+
+# Driver Pool
+DRIVER_POOL_SIZE = 1  # warm browsers kept between tests
+DRIVER_MAX_USES = 20  # tests served by one browser before it is recycled
+
+# Authenticated Session Cache
+SESSION_CACHE_DIR = ROOTDIR / ".sessions"
+SESSION_CACHE_TTL = 30 * 60  # seconds a cached login is trusted, 0 disables the cache
+
+# Profiling
+PROFILE_DIR = ROOTDIR / ".profiles"
+
+# Step Logs
+STEP_LOG_LIMIT = 0  # steps and verifies kept per test for the report, the oldest are dropped first, 0 keeps all
+
+# Screenshots
+SCREENSHOT_MAX_WIDTH = 1280  # attached screenshots are downscaled to this width
+SCREENSHOT_QUALITY = 70  # JPEG quality of attached screenshots
+SCREENSHOT_QUEUE_SIZE = 16  # screenshots waiting for encoding before captures block
+
+# Android Device Sharding
+DEVICE_LEASE_DIR = ROOTDIR / ".devices"
+DEVICE_LEASE_WAIT = 300  # seconds to wait for a free device
+APPIUM_BASE_PORT = 4723
+SYSTEM_BASE_PORT = 8200  # UiAutomator2 server port on the host
+MJPEG_BASE_PORT = 9200  # screen streaming port on the host
@@ -1,3 +1,8 @@
+import sys
+import time
+from collections import deque
+
+
 class DriverList:
     web_driver = []
     android_driver = []
@@ -6,7 +11,202 @@ class DriverList:
 
 
 class StepLogs:
-    test_steps = []
-    broken_steps = []
-    all_failed_logs = []
+    """
+    Steps, verifies, failures and broken steps logged by the running test, started and ended around every test
+    by the pytest hooks (nothing is recorded outside of a test).
+    With `max_entries` the step tree is a ring buffer: the oldest steps (and then the oldest verifies of the
+    current step) are dropped with their failure/broken records, `memory` counts the approximate bytes kept.
+    """
+    test = None  # node id of the running test
+    max_entries = 0  # steps and verifies kept per test, 0 keeps all
+
+    # step tree of the test: {"id", "name", "start", "stop", "verifies", "dropped"}, verifies {"id", "name", "start",
+    # "stop"}, times in ms. Ids are 1-based numbers in the order logged ("2" second step, "2.3" its third verify,
+    # "0.n" verifies logged before any step) and are kept when older entries are dropped
+    steps = deque()
+    loose_step = None  # holds the verifies logged before any step, not part of the tree
+    dropped_steps = 0
+    current_step = None  # step being run
+    last_verify = None  # latest verify, it may belong to an earlier step
+    last_entry = None  # latest step or verify
+    failed_steps = {}  # step id -> (step key, message of its first failure)
+    broken_steps = {}  # step id -> step key
     is_broken = False
+
+    entries = 0  # steps and verifies kept
+    evicted = 0  # steps and verifies dropped
+    memory = 0  # approximate bytes of the logs of the test
+    peak_memory = 0  # of the session
+
+    @classmethod
+    def configure(cls, max_entries=0):
+        cls.max_entries = max_entries
+
+    @classmethod
+    def begin(cls, test: str):
+        """Start the logs of a test."""
+        cls.reset()
+        cls.test = test
+
+    @classmethod
+    def end(cls) -> dict:
+        """Drop the logs of the finished test, return what they held."""
+        stats = dict(test=cls.test, entries=cls.entries, evicted=cls.evicted, memory=cls.memory)
+        cls.reset()
+        return stats
+
+    @classmethod
+    def reset(cls):
+        """Start a clean log so no step or failure leaks into another test's report."""
+        cls.test = None
+        cls.steps = deque()
+        cls.loose_step = _step_node("0", "")
+        cls.dropped_steps = 0
+        cls.current_step = None
+        cls.last_verify = None
+        cls.last_entry = None
+        cls.failed_steps = {}
+        cls.broken_steps = {}
+        cls.is_broken = False
+        cls.entries = cls.evicted = cls.memory = 0
+
+    @classmethod
+    def record(cls, message: str):
+        """Record a logged message as a step, or a verify of the current step ("step" wins when it has both)."""
+        if cls.test is None:
+            return
+
+        lowered = message.lower()
+        if "step" in lowered:
+            cls.step(message)
+
+        elif "verify" in lowered:
+            cls.verify(message)
+
+    @classmethod
+    def step(cls, name: str):
+        """Start a step, it ends when the next one starts."""
+        now = _now_ms()
+        cls._close_verify(now)
+        if cls.current_step is not None:
+            cls.current_step["stop"] = now
+
+        cls.current_step = cls.last_entry = _step_node(str(cls.dropped_steps + len(cls.steps) + 1), name, now)
+        cls.steps.append(cls.current_step)
+        cls._added(cls.current_step)
+
+    @classmethod
+    def verify(cls, name: str):
+        """Start a verify of the current step, it ends when the next verify or step starts."""
+        now = _now_ms()
+        cls._close_verify(now)
+
+        parent = cls.loose_step if cls.current_step is None else cls.current_step
+        cls.last_verify = cls.last_entry = dict(
+            id=f"{parent['id']}.{parent['dropped'] + len(parent['verifies']) + 1}", name=name, start=now, stop=None
+        )
+        parent["verifies"].append(cls.last_verify)
+        cls._added(cls.last_verify)
+
+    @classmethod
+    def fail(cls, message: str):
+        """Record a failure of the latest verify (of the latest step before any verify), its first message is kept."""
+        node = cls.last_verify or cls.last_entry
+        if node is not None and node["id"] not in cls.failed_steps:
+            cls.failed_steps[node["id"]] = (cls.key(node["name"]), message)
+            cls._count_memory(sys.getsizeof(message))
+
+    @classmethod
+    def mark_broken(cls):
+        """Record the latest step or verify as broken, and the current step when it is a verify."""
+        entry = cls.last_entry
+        if entry is None:
+            return
+
+        cls.broken_steps[entry["id"]] = cls.key(entry["name"])
+        if entry is cls.last_verify and cls.current_step is not None:
+            cls.broken_steps[cls.current_step["id"]] = cls.key(cls.current_step["name"])
+
+    @classmethod
+    def positions(cls, records: dict) -> dict:
+        """Records keyed by their position in the kept step tree (what `log_step_to_allure` adds) instead of id."""
+        dropped = {step["id"]: step["dropped"] for step in cls.steps if step["dropped"]}
+        if not cls.dropped_steps and not dropped:
+            return dict(records)
+
+        positioned = {}
+        for step_id, record in records.items():
+            step_no, _, verify_no = step_id.partition(".")
+            position = str(int(step_no) - cls.dropped_steps)
+            if verify_no:
+                position += f".{int(verify_no) - dropped.get(step_no, 0)}"
+            positioned[position] = record
+
+        return positioned
+
+    @staticmethod
+    def key(name: str) -> str:
+        """Normalized step name, what steps of an allure result are matched by."""
+        return " ".join(name.lower().split())
+
+    @classmethod
+    def _close_verify(cls, now: int):
+        if cls.last_verify is not None and cls.last_verify["stop"] is None:
+            cls.last_verify["stop"] = now
+
+    @classmethod
+    def _added(cls, node: dict):
+        cls.entries += 1
+        cls._count_memory(_node_size(node))
+        if cls.max_entries:
+            cls._evict()
+
+    @classmethod
+    def _evict(cls):
+        """Drop the oldest entries beyond `max_entries`: verifies before any step, older steps, current verifies."""
+        while cls.entries > cls.max_entries:
+            if cls.loose_step["verifies"]:
+                cls._drop(cls.loose_step["verifies"].popleft(), cls.loose_step)
+
+            elif cls.steps and cls.steps[0] is not cls.current_step:
+                step = cls.steps.popleft()
+                while step["verifies"]:
+                    cls._drop(step["verifies"].popleft(), step)
+                cls._drop(step)
+                cls.dropped_steps += 1
+
+            elif cls.current_step is not None and len(cls.current_step["verifies"]) > 1:
+                # the latest verify is kept, failures are still recorded against it
+                cls._drop(cls.current_step["verifies"].popleft(), cls.current_step)
+
+            else:
+                break
+
+    @classmethod
+    def _drop(cls, node: dict, parent: dict = None):
+        if parent is not None:
+            parent["dropped"] += 1
+
+        failure = cls.failed_steps.pop(node["id"], None)
+        cls.broken_steps.pop(node["id"], None)
+        cls.entries -= 1
+        cls.evicted += 1
+        cls.memory -= _node_size(node) + (sys.getsizeof(failure[1]) if failure else 0)
+
+    @classmethod
+    def _count_memory(cls, size: int):
+        cls.memory += size
+        cls.peak_memory = max(cls.peak_memory, cls.memory)
+
+
+def _step_node(step_id: str, name: str, start: int = 0) -> dict:
+    return dict(id=step_id, name=name, start=start, stop=None, verifies=deque(), dropped=0)
+
+
+def _node_size(node: dict) -> int:
+    size = sys.getsizeof(node) + sys.getsizeof(node["name"])
+    return size + sys.getsizeof(node["verifies"]) if "verifies" in node else size
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
@@ -156,11 +156,11 @@ class DemoAccountModal(BasePage):
         Returns:
             dict: Dictionary containing userid, name, and deposit
         """
-        return DotDict(
-            userid=self.actions.get_text(self.__demo_acc_userid),
-            password=self.actions.get_text(self.__demo_acc_password),
-            username=self.actions.get_text(self.__demo_acc_name),
-        )
+        with self.actions.snapshot():
+            userid, password, username = self.actions.get_texts(
+                [self.__demo_acc_userid, self.__demo_acc_password, self.__demo_acc_name]
+            )
+        return DotDict(userid=userid, password=password, username=username)
 
     def sign_in_from_completion(self):
         """Clicks the sign-in button on the demo account completion modal."""
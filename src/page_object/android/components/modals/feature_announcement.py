@@ -1,6 +1,7 @@
 from appium.webdriver.common.appiumby import AppiumBy
 
 from src.core.actions.mobile_actions import MobileActions
+from src.data.consts import SHORT_WAIT
 from src.page_object.android.base_page import BasePage
 
 
@@ -15,8 +16,16 @@ class FeatureAnnouncementModal(BasePage):
     # ------------------------ ACTIONS ------------------------ #
     def got_it(self):
         """Click the 'Got it' button to dismiss the feature announcement."""
-        while self.actions.is_element_displayed(self.__btn_got_it):
+        # announcements show up with the page, one bounded check tells whether there is any
+        if not self.actions.is_element_displayed(self.__btn_got_it, timeout=SHORT_WAIT):
+            return
+
+        while True:
             self.actions.click(self.__btn_got_it)
+            # the next announcement (if any) is rendered once the dismissed one has faded out
+            self.actions.is_element_invisible(self.__btn_got_it, timeout=SHORT_WAIT)
+            if not self.actions.probe(self.__btn_got_it):
+                break
 
     def try_it_now(self):
         """Click the 'Try it now' button to try the new feature."""
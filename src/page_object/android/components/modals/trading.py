@@ -91,18 +91,18 @@ class TradingModals(BasePage):
     # ------------------------ VERIFY ------------------------ #
     def verify_confirmation_modal_displayed(self):
         """Verify that the order confirmation modal is displayed."""
-        self.actions.verify_element_is_displayed(self.__order_confirmation_modal)
-        self.actions.verify_element_is_displayed(self.__order_details)
+        with self.actions.snapshot():
+            self.actions.verify_elements_are_displayed([self.__order_confirmation_modal, self.__order_details])
 
     def verify_success_modal_displayed(self):
         """Verify that the order success modal is displayed."""
-        self.actions.verify_element_is_displayed(self.__order_success_modal)
-        self.actions.verify_element_is_displayed(self.__success_message)
+        with self.actions.snapshot():
+            self.actions.verify_elements_are_displayed([self.__order_success_modal, self.__success_message])
 
     def verify_error_modal_displayed(self):
         """Verify that the order error modal is displayed."""
-        self.actions.verify_element_is_displayed(self.__order_error_modal)
-        self.actions.verify_element_is_displayed(self.__error_message)
+        with self.actions.snapshot():
+            self.actions.verify_elements_are_displayed([self.__order_error_modal, self.__error_message])
 
     def verify_success_message(self, expected_message: str):
         """Verify the success message.
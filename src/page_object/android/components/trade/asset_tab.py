@@ -40,8 +40,8 @@ class AssetTab(BasePage):
     # ------------------------ VERIFY ------------------------ #
     def verify_tab_displayed(self):
         """Verify that the asset tab is displayed."""
-        self.actions.verify_element_is_displayed(self.__tab_container)
-        self.actions.verify_element_is_displayed(self.__tab_item)
+        with self.actions.snapshot():
+            self.actions.verify_elements_are_displayed([self.__tab_container, self.__tab_item])
 
     def verify_asset_in_tab(self, asset_name: str):
         """Verify that an asset is present in the tab.
@@ -26,7 +26,7 @@ class LoginPage(BasePage):
     __lnk_reset_password = (AppiumBy.XPATH, "//*[@resource-id='reset-password-link']")
     __btn_sign_up = (AppiumBy.XPATH, "//*[@resource-id='login-account-signup']")
     __alert_error = (AppiumBy.XPATH, "//*[@resource-id='alert-error']")
-    __btn_skip = (AppiumBy.XPATH, "//*[resource-id='ads-skip-button']")
+    __btn_skip = (AppiumBy.XPATH, "//*[@resource-id='ads-skip-button']")
 
     # ------------------------ ACTIONS ------------------------ #
     def select_account_tab(self, account_type: AccountType):
@@ -44,7 +44,8 @@ class LoginPage(BasePage):
 
     def login(self, userid, password, account_type: AccountType, language: Language = None):
 
-        while self.actions.is_element_displayed(self.__btn_skip, timeout=15):
+        # skip the ads until the login form shows up
+        while self.actions.wait_first([self.__btn_skip, self.__txt_user_id], timeout=15) == self.__btn_skip:
             self.actions.click(self.__btn_skip)
 
         if language:
@@ -79,10 +80,8 @@ class LoginPage(BasePage):
         )
 
     def verify_account_autofill_value(self, userid, password):
-        actual_userid = self.actions.get_attribute(self.__txt_user_id, "value")
+        actual_userid, actual_password = self.actions.get_attributes([self.__txt_user_id, self.__txt_password], "value")
         soft_assert(actual_userid, str(userid))
-
-        actual_password = self.actions.get_attribute(self.__txt_password, "value")
         soft_assert(actual_password, password)
 
     def verify_alert_error_message(self, expected_message):
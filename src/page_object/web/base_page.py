@@ -31,6 +31,14 @@ class BasePage:
         """
         self.actions.wait_for_element_invisible(self.__spin_loader, timeout=timeout)
 
+    def wait_for_network_idle(self, timeout: int = EXPLICIT_WAIT):
+        """Wait for the requests of the page to settle.
+
+        Args:
+            timeout (int): Maximum time to wait in seconds
+        """
+        self.actions.wait_for_network_idle(timeout=timeout)
+
     # ------------------------ VERIFY ------------------------ #
     def verify_page_url(self, url_path: str, timeout: int = EXPLICIT_WAIT):
         """Verify that the current URL matches the expected page URL.
@@ -64,29 +64,30 @@ class DemoAccountModal(BasePage):
             self.actions.click(cook_element(self.__item_deposit, deposit))
 
     def agree_and_continue(self, check=True):
-        if check and self.actions.is_element_displayed(self.__chb_agreement_unchecked, timeout=3):
+        state = self.actions.wait_first([self.__chb_agreement_unchecked, self.__chb_agreement_checked], timeout=3)
+
+        if check and state == self.__chb_agreement_unchecked:
             self.actions.click(self.__chb_agreement_unchecked)
             return
 
-        if not check and self.actions.is_element_displayed(self.__chb_agreement_checked, timeout=3):
+        if not check and state == self.__chb_agreement_checked:
             self.actions.click(self.__chb_agreement_checked)
             return
 
     def click_next_button(self):
         self.actions.click(self.__btn_next)
 
-    def fill_demo_account_creation_form(self, account_info: ObjectDemoAccount, default_deposit=False):
-        if account_info.name:
-            self.input_name(account_info.name)
-
-        if account_info.email:
-            self.input_email(account_info.email)
-
+    def fill_demo_account_creation_form(self, account_info: ObjectDemoAccount, default_deposit=False, typing=False):
         if account_info.dial_code:
             self.select_dial_code(account_info.dial_code)
 
-        if account_info.phone_number:
-            self.input_phone_number(account_info.phone_number)
+        fields = {
+            self.__txt_name: account_info.name,
+            self.__txt_email: account_info.email,
+            self.__txt_phone_number: account_info.phone_number,
+        }
+        logger.debug(f"- Phone number: {account_info.phone_number!r}")
+        self.actions.fill_form({locator: value for locator, value in fields.items() if value}, typing=typing)
 
         self.select_deposit(account_info.deposit, use_default=default_deposit)
 
@@ -136,7 +137,7 @@ class DemoAccountModal(BasePage):
             error_list = [error_dict[field] for field in fields]
 
         # Get actual error messages
-        error_messages = [element.text.strip() for element in self.actions._find_elements(self.__field_validation)]
+        error_messages = self.actions.get_all_texts(self.__field_validation)
 
         # Verify expected errors are present
         for expected_error in error_list:
@@ -170,11 +171,10 @@ class DemoAccountModal(BasePage):
         Returns:
             dict: Dictionary containing userid, name, and deposit
         """
-        return DotDict(
-            userid=self.actions.get_text(self.__demo_acc_userid),
-            password=self.actions.get_text(self.__demo_acc_password),
-            username=self.actions.get_text(self.__demo_acc_name),
+        userid, password, username = self.actions.get_texts(
+            [self.__demo_acc_userid, self.__demo_acc_password, self.__demo_acc_name]
         )
+        return DotDict(userid=userid, password=password, username=username)
 
     def sign_in_from_completion(self):
         """Clicks the sign-in button on the demo account completion modal."""
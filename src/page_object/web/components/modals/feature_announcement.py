@@ -1,6 +1,7 @@
 from selenium.webdriver.common.by import By
 
 from src.core.actions.web_actions import WebActions
+from src.data.consts import SHORT_WAIT
 from src.page_object.web.base_page import BasePage
 
 
@@ -21,8 +22,16 @@ class FeatureAnnouncementModal(BasePage):
         Will continue clicking if multiple announcements are present.
         """
         self.wait_for_loader()
-        while self.actions.is_element_displayed(self.__btn_got_it_feature_ann, timeout=5):
+        # announcements show up with the page, one bounded check tells whether there is any
+        if not self.actions.is_element_displayed(self.__btn_got_it_feature_ann, timeout=SHORT_WAIT):
+            return
+
+        while True:
             self.actions.click(self.__btn_got_it_feature_ann)
+            # the next announcement (if any) is rendered once the dismissed one has faded out
+            self.actions.is_element_invisible(self.__btn_got_it_feature_ann, timeout=SHORT_WAIT)
+            if not self.actions.probe(self.__btn_got_it_feature_ann):
+                break
 
     def try_it_now(self):
         """Clicks the 'Try it now' button on the feature announcement modal."""
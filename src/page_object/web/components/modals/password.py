@@ -20,27 +20,29 @@ class PasswordModal(BasePage):
     __btn_confirm = (By.CSS_SELECTOR, "button[data-testid='change-password-modal-confirm']")
 
     # ------------------------ ACTIONS ------------------------ #
-    def change_password(self, old_password, new_password):
+    def change_password(self, old_password, new_password, typing=False):
         """
         Changes the user's password using the change password modal.
         Args:
             old_password (str): Current password
             new_password (str): New password to set
+            typing (bool): Type the passwords key by key instead of filling the form at once
         """
-        self.actions.send_keys(self.__txt_old_password, old_password)
-        self.actions.send_keys(self.__txt_new_password, new_password)
-        self.actions.send_keys(self.__txt_confirm_new_password, new_password)
+        self.actions.fill_form({
+            self.__txt_old_password: old_password,
+            self.__txt_new_password: new_password,
+            self.__txt_confirm_new_password: new_password,
+        }, typing=typing)
         self.actions.click(self.__btn_confirm)
 
     # ------------------------ VERIFY ------------------------ #
 
     # ======================== RESET PASSWORD ======================== #
-    __txt_email = (By.XPATH, "//input[placeholder='user@gmail.com']")
-    __txt_account_id = (By.XPATH, "//input[placeholder='Enter your account ID']")
+    __txt_email = (By.XPATH, "//input[@placeholder='user@gmail.com']")
+    __txt_account_id = (By.XPATH, "//input[@placeholder='Enter your account ID']")
     __btn_submit = (By.XPATH, "//button[text()='Submit']")
 
-    def fill_reset_password_form(self, email=random_email(), account_id=random_userid()):
-        self.actions.send_keys(self.__txt_email, email)
-        self.actions.send_keys(self.__txt_account_id, account_id)
+    def fill_reset_password_form(self, email=random_email(), account_id=random_userid(), typing=False):
+        self.actions.fill_form({self.__txt_email: email, self.__txt_account_id: account_id}, typing=typing)
         self.actions.click(self.__btn_submit)
 
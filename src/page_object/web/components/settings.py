@@ -31,10 +31,10 @@ class Settings(BasePage):
         self.actions.click(cook_element(self.__opt_setting, SettingOpt.CHANGE_LANGUAGE))
         self.actions.click(cook_element(self.__opt_language, language))
 
-    def change_password(self, old_password, new_password):
+    def change_password(self, old_password, new_password, typing=False):
         self.__open_setting()
         self.actions.click(cook_element(self.__opt_setting, SettingOpt.CHANGE_PASSWORD))
-        self.__change_password_modal.change_password(old_password, new_password)
+        self.__change_password_modal.change_password(old_password, new_password, typing)
 
     def logout(self):
         self.__open_setting()
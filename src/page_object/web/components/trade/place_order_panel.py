@@ -47,11 +47,15 @@ class PlaceOrderPanel(BasePage):
     __opt_fill_policy = (By.CSS_SELECTOR, "*[data-testid='trade-dropdown-fill-policy-{}']")
 
     # ------------------------ ACTIONS ------------------------ #
+    def __get_oct_toggle(self):
+        """Return the toggle locator matching the current One-Click Trading state"""
+        return self.actions.wait_first([self.__toggle_oct, self.__toggle_oct_checked], timeout=5)
+
     def enable_oct(self):
         """
         Enable One-Click Trading by clicking the toggle if it's not already enabled
         """
-        if self.actions.is_element_displayed(self.__toggle_oct, timeout=5):
+        if self.__get_oct_toggle() == self.__toggle_oct:
             self.actions.click(self.__toggle_oct)
         self.actions.click(self.__btn_oct_confirm)
 
@@ -59,7 +63,7 @@ class PlaceOrderPanel(BasePage):
         """
         Disable One-Click Trading by clicking the toggle if it's currently enabled
         """
-        if self.actions.is_element_displayed(self.__toggle_oct_checked, timeout=5):
+        if self.__get_oct_toggle() == self.__toggle_oct_checked:
             self.actions.click(self.__toggle_oct_checked)
         self.actions.click(self.__btn_oct_confirm)
 
@@ -34,6 +34,4 @@ class HomePage(BasePage):
     # ------------------------ VERIFY ------------------------ #
     def verify_account_info_displayed(self):
         """Verify that account information is displayed"""
-        self.actions.verify_element_is_displayed(self.__account_selector)
-        self.actions.verify_element_is_displayed(self.__account_name)
-        self.actions.verify_element_is_displayed(self.__account_id)
+        self.actions.verify_elements_are_displayed([self.__account_selector, self.__account_name, self.__account_id])
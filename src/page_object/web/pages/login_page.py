@@ -1,11 +1,15 @@
+from selenium.common import WebDriverException
 from selenium.webdriver.common.by import By
 
 from src.core.actions.web_actions import WebActions
-from src.data.enums import AccountType, Language
+from src.core.config_manager import Config
+from src.core.session_cache import SessionCache
+from src.data.enums import AccountType, Language, Server, URLPaths
 from src.page_object.web.base_page import BasePage
 from src.page_object.web.components.modals.demo_account import DemoAccountModal
 from src.utils.assert_utils import soft_assert
 from src.utils.common_utils import cook_element, translate_sign_in
+from src.utils.logging_utils import logger
 
 
 class LoginPage(BasePage):
@@ -22,6 +26,7 @@ class LoginPage(BasePage):
     __btn_login = (By.CSS_SELECTOR, "button[data-testid='login-submit']")
     __forgot_password = (By.CSS_SELECTOR, "*[data-testid='reset-password-link']")
     __open_demo_account = (By.CSS_SELECTOR, "*[data-testid='login-account-signup']")
+    __account_selector = (By.CSS_SELECTOR, "*[data-testid='account-selector']")  # shown once logged in
 
     # ------------------------ ACTIONS ------------------------ #
 
@@ -38,15 +43,51 @@ class LoginPage(BasePage):
     def click_forgot_password(self):
         self.actions.click(self.__forgot_password)
 
-    def login(self, userid, password, account_type: AccountType, language: Language = None):
+    def login(self, userid, password, account_type: AccountType, language: Language = None, typing=False):
         if language:
             self.select_language(language)
 
         self.select_account_tab(account_type)
-        self.actions.send_keys(self.__txt_user_id, str(userid))
-        self.actions.send_keys(self.__txt_password, str(password))
+        self.actions.fill_form({self.__txt_user_id: userid, self.__txt_password: password}, typing=typing)
         self.actions.click(self.__btn_login)
 
+    def login_with_session(self, server: Server, account_type: AccountType):
+        """
+        Land on the trade page as a logged-in user.
+        Reuse the cached session of this env/client/server/account when there is one,
+        otherwise (or when it turns out to be expired) login through the UI and cache the new session.
+        """
+        key = SessionCache.key(server, account_type)
+        state = SessionCache.load(key)
+
+        if state:
+            try:
+                self.actions.restore_session_state(state, Config.get_url_path(URLPaths.TRADE))
+                # a rejected session lands back on the login form, no need to wait for the full timeout
+                landed = self.actions.wait_first([self.__account_selector, self.__txt_user_id])
+                restored = landed == self.__account_selector
+
+            except WebDriverException as e:
+                # e.g. cookies of another host, or rejected by the browser
+                logger.debug(f"- Cached session {key!r} could not be restored: {type(e).__name__}")
+                restored = False
+
+            if restored:
+                logger.debug(f"- Logged in with cached session {key!r}")
+                return
+
+            logger.debug(f"- Cached session {key!r} was rejected, login again")
+            SessionCache.invalidate(key)
+            self.actions.clear_session_state()
+            self.actions.goto(Config.get_url_site())
+
+        credentials = Config.get_credentials(server, account_type)
+        self.login(credentials.username, credentials.password, account_type)
+        self.actions.wait_for_url(Config.get_url_path(URLPaths.TRADE))
+
+        if self.actions.is_element_displayed(self.__account_selector):
+            SessionCache.save(key, self.actions.get_session_state())
+
     def open_demo_account_creation(self):
         self.select_account_tab(AccountType.DEMO)
         self.actions.click(self.__open_demo_account)
@@ -59,11 +100,9 @@ class LoginPage(BasePage):
     def verify_account_tabs_is_displayed(self):
         acc_tab_demo = cook_element(self.__tab_account_type, AccountType.DEMO)
         acc_tab_live = cook_element(self.__tab_account_type, AccountType.LIVE)
-        # Check account tab demo is displayed
-        soft_assert(self.actions.is_element_displayed(acc_tab_demo), True)
-
-        # Check account tab live is displayed
-        soft_assert(self.actions.is_element_displayed(acc_tab_live), True)
+        displayed = self.actions.wait_all([acc_tab_demo, acc_tab_live])
+        soft_assert(displayed[acc_tab_demo], True, "Account tab demo is not displayed")
+        soft_assert(displayed[acc_tab_live], True, "Account tab live is not displayed")
 
     def verify_account_tab_is_selected(self, account_type: AccountType):
         # verify 'selected' in class attribute of account tab
@@ -76,8 +115,6 @@ class LoginPage(BasePage):
         )
 
     def verify_account_autofill_value(self, userid, password):
-        actual_userid = self.actions.get_attribute(self.__txt_user_id, "value")
+        actual_userid, actual_password = self.actions.get_attributes([self.__txt_user_id, self.__txt_password], "value")
         soft_assert(actual_userid, str(userid))
-
-        actual_password = self.actions.get_attribute(self.__txt_password, "value")
         soft_assert(actual_password, password)
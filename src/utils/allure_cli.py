@@ -0,0 +1,115 @@
+"""
+Re-run the allure result customization offline over a results directory, across a process pool:
+zero-duration fix, attachment cleanup and renaming of every *result.json (written back as compact JSON),
+then removal of the .txt log files. Files whose content did not change since they were processed
+(content hash recorded in the manifest of the directory) are skipped.
+
+    python -m src.utils.allure_cli allure-results --workers 8
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # the standard codec is enough, only slower
+    orjson = None
+
+from src.utils.allure_utils import _remove_zero_duration, _cleanup_and_customize_report, clean_allure_log_files
+
+MANIFEST = ".customized.json"  # result file name -> hash of its processed content
+
+
+def loads(raw: bytes):
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def dumps(data) -> bytes:
+    if orjson:
+        return orjson.dumps(data)
+
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def process_file(path: str, known_digest: str | None) -> tuple[str, str | None, int, str]:
+    """
+    Customize one result file unless its content hash is `known_digest`.
+    Returns (path, hash of the processed content or None when it failed, bytes read, status).
+    """
+    try:
+        raw = Path(path).read_bytes()
+        if hashlib.sha1(raw).hexdigest() == known_digest:
+            return path, known_digest, len(raw), "skipped"
+
+        data = loads(raw)
+        _remove_zero_duration(data)
+        _cleanup_and_customize_report(data)
+        processed = dumps(data)
+
+        # write then rename, an interrupted run never leaves a half written result
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(processed)
+        os.replace(tmp_path, path)
+
+        return path, hashlib.sha1(processed).hexdigest(), len(raw), "processed"
+
+    except Exception as e:
+        return path, None, 0, f"{type(e).__name__}: {e}"
+
+
+def run(results_dir, workers: int = None, chunksize: int = 64) -> dict:
+    """Process the results directory, return the counts and throughput of the run."""
+    results_dir = Path(results_dir).absolute()
+    manifest_path = results_dir / MANIFEST
+    manifest = loads(manifest_path.read_bytes()) if manifest_path.exists() else {}
+
+    start = time.perf_counter()
+    files = [entry.path for entry in os.scandir(results_dir) if entry.name.endswith("result.json")]
+    known = [manifest.get(os.path.basename(path)) for path in files]
+
+    stats = dict(files=len(files), processed=0, skipped=0, failed=0, bytes=0)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for path, digest, size, status in executor.map(process_file, files, known, chunksize=chunksize):
+            stats["bytes"] += size
+            if digest is None:
+                stats["failed"] += 1
+                print(f"!! {os.path.basename(path)}: {status}")
+                continue
+
+            stats[status] += 1
+            manifest[os.path.basename(path)] = digest
+
+    manifest_path.write_bytes(dumps(manifest))
+    stats["logs_removed"] = clean_allure_log_files(results_dir)
+
+    elapsed = time.perf_counter() - start
+    stats.update(
+        seconds=round(elapsed, 3),
+        files_per_second=round(len(files) / elapsed, 1) if elapsed else 0.0,
+        mb_per_second=round(stats["bytes"] / 1e6 / elapsed, 2) if elapsed else 0.0,
+        codec="orjson" if orjson else "json",
+    )
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Customize an allure results directory offline")
+    parser.add_argument("results_dir", help="Allure results directory")
+    parser.add_argument("--workers", type=int, default=None, help="Processes of the pool, CPU count by default")
+    parser.add_argument("--chunksize", type=int, default=64, help="Files sent to a process at once")
+    args = parser.parse_args()
+
+    result = run(args.results_dir, args.workers, args.chunksize)
+    print(
+        f"{result['processed']} processed, {result['skipped']} skipped, {result['failed']} failed "
+        f"of {result['files']} result files, {result['logs_removed']} log files removed"
+    )
+    print(
+        f"{result['seconds']}s: {result['files_per_second']} files/s, {result['mb_per_second']} MB/s "
+        f"({result['codec']})"
+    )
@@ -0,0 +1,51 @@
+"""
+The one place reaching into allure-pytest: the result it is reporting right now.
+allure has no public API for adding timed steps to a test, or for attaching a file that is written later,
+both need the reporter of the allure-pytest plugin (its `allure_logger` attribute).
+The access is only used on the allure-pytest versions it was checked against (`SUPPORTED_VERSIONS`),
+on any other version callers fall back to the public `allure.step` / `allure.attach` API.
+"""
+import importlib.metadata
+from functools import cache
+
+import allure_commons
+from allure_commons.model2 import ExecutableItem
+
+SUPPORTED_VERSIONS = ("2.",)  # allure-pytest major versions the reporter access was checked against
+
+
+@cache
+def reporter_supported() -> bool:
+    """Whether the installed allure-pytest is a version the reporter access was checked against."""
+    try:
+        version = importlib.metadata.version("allure-pytest")
+
+    except importlib.metadata.PackageNotFoundError:
+        return False
+
+    return version.startswith(SUPPORTED_VERSIONS)
+
+
+def allure_reporter():
+    """Reporter of the allure-pytest plugin, None when allure is not reporting or its version is not supported."""
+    if not reporter_supported():
+        return None
+
+    for plugin in allure_commons.plugin_manager.get_plugins():
+        reporter = getattr(plugin, "allure_logger", None)
+        if reporter is not None and hasattr(reporter, "get_last_item") and hasattr(reporter, "get_test"):
+            return reporter
+
+    return None
+
+
+def running_item():
+    """Test, fixture or step being reported (what `allure.attach` attaches to), None when there is none."""
+    reporter = allure_reporter()
+    return reporter.get_last_item(ExecutableItem) if reporter else None
+
+
+def running_test():
+    """Test result being reported, None when there is none."""
+    reporter = allure_reporter()
+    return reporter.get_test(None) if reporter else None
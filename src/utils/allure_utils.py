@@ -1,15 +1,22 @@
 import glob
-import json
 import os
-from typing import Dict, Any
+import time
 
 import allure
+import allure_commons
+from allure_commons.model2 import Status, StatusDetails, TestStepResult
 
 from src.core.config_manager import Config
 from src.data.consts import ROOTDIR, GRID_S3_BUCKET_URL
 from src.data.project_info import StepLogs
+from src.utils.allure_reporter_utils import reporter_supported, running_test
 from src.utils.file_utils import save_recorded_video
 from src.utils.logging_utils import logger
+from src.utils.screenshot_utils import ScreenshotPipeline
+
+
+# test level attachments left on the customized results
+KEPT_ATTACHMENTS = ("Screen Recording", "Action profile", "Command profile")
 
 
 def capture_and_attach_video(driver):
@@ -36,162 +43,231 @@ def capture_and_attach_video(driver):
 
 
 def capture_and_attach_screenshot(driver, name="screenshot"):
+    """Attach a screenshot to the running test, encoded and written in the background (see ScreenshotPipeline)."""
     try:
-        allure.attach(driver.get_screenshot_as_png(), name=name, attachment_type=allure.attachment_type.PNG)
+        ScreenshotPipeline.capture(driver, name)
     except Exception as e:
         logger.error(f"Failed to capture screenshot: {str(e)}")
 
 
 def log_step_to_allure():
-    """Add recorded steps from logger to allure"""
-    test_steps = []
-    test_steps_log = StepLogs.test_steps
+    """Add the recorded step tree of the test to its allure result, timed from when each step and verify was logged."""
+    if not reporter_supported():
+        # allure-pytest version not checked, report the steps through the public API (without their timings)
+        for step in StepLogs.steps:
+            with allure.step(step["name"]):
+                for verify in step["verifies"]:
+                    with allure.step(verify["name"]):
+                        pass
+        return
 
-    steps_index = [
-        index for index, value in enumerate(test_steps_log) if ("step" or "steps") in value.lower()
-    ]
+    test = running_test()
+    if test is None:
+        return
 
-    for i in range(len(steps_index)):
-        if i == len(steps_index) - 1:
-            test_steps.append(test_steps_log[steps_index[i]:])
-            break
+    now = int(time.time() * 1000)
+    for step in StepLogs.steps:
+        stop = step["stop"] or now
+        test.steps.append(TestStepResult(
+            name=step["name"], status=Status.PASSED, start=step["start"], stop=stop,
+            steps=[
+                TestStepResult(
+                    name=verify["name"], status=Status.PASSED, start=verify["start"], stop=verify["stop"] or stop
+                )
+                for verify in step["verifies"]
+            ]
+        ))
 
-        test_steps.append(test_steps_log[steps_index[i]:steps_index[i + 1]])
 
-    for steps in test_steps:
-        step = steps.pop(0)
-        with allure.step(step):
-            for verify in steps:
-                with allure.step(verify):
-                    pass
+class AllureResultTracker:
+    """
+    Customize every allure result of this process while it is produced, before the allure file logger writes it,
+    with the step logs of its own test (they are kept until the test is reported, see `StepLogs.begin/end`).
+    """
 
-    del test_steps_log[:]
+    def __init__(self):
+        self.customized = 0
 
+    @allure_commons.hookimpl(tryfirst=True)
+    def report_result(self, result):
+        try:
+            customize_result(
+                result, StepLogs.positions(StepLogs.failed_steps), StepLogs.positions(StepLogs.broken_steps)
+            )
+            self.customized += 1
 
-def custom_allure_report(allure_dir: str) -> None:
-    """Process and customize Allure test result files in the specified directory."""
-    allure_dir_path = ROOTDIR / allure_dir
-    # get all allure result files
-    allure_result_files = [f for f in os.listdir(allure_dir_path) if f.endswith("result.json")]
-    # Sort result files based on created time (newest first)
-    files = [os.path.join(allure_dir_path, f) for f in allure_result_files]
-    files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        except Exception as e:
+            logger.error(f"Error customizing result of {result.name!r}: {str(type(e).__name__)}, {str(e)}")
 
-    for file_path in files:
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
 
-            _remove_zero_duration(data)
+result_tracker = AllureResultTracker()
 
-            # Process failed status
-            if data["status"] == "failed":
-                _process_failed_status(data)
 
-            # Process broken status
-            if StepLogs.broken_steps:
-                _process_broken_status(data)
+def customize_result(data, failed_steps: dict, broken_steps: dict) -> None:
+    """
+    Customize one allure test result, either the result model being reported or the dict of a result file.
+    Failed and broken steps are the StepLogs records by position in the step tree (see `StepLogs.positions`):
+    "2.3" -> (step key, message of a failure) for the third verify of the second step.
+    Steps recorded by StepLogs are timed, results written before carry zero-duration steps (see `allure_cli`).
+    """
+    # Process failed status
+    if _get(data, "status") == "failed" and failed_steps:
+        _process_failed_status(data, failed_steps)
 
-            # Clean up and customize report
-            _cleanup_and_customize_report(data)
+    # Process broken status
+    if broken_steps:
+        _process_broken_status(data, broken_steps)
 
-            # Write back the modified data
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(data, file, indent=4)
+    # Clean up and customize report
+    _cleanup_and_customize_report(data)
 
-        except Exception as e:
-            logger.error(f"Error processing file {os.path.basename(file_path)}: {str(type(e).__name__)}, {str(e)}")
-            continue
 
+# The allure result model uses the attribute names of the result JSON keys, the helpers below work on both
+def _get(item, key, default=None):
+    value = item.get(key) if isinstance(item, dict) else getattr(item, key, None)
+    return default if value is None else value
 
-def _process_failed_status(data: Dict[str, Any]) -> None:
-    """Process failed test status and update steps."""
-    failed_attachments = list(
-        filter(lambda x: x["name"] == "screenshot", data.get("attachments", []))
-    )
 
-    for item in data.get("steps", []):
-        for v_step in item.get("steps", []):
-            for failed_step, msg_detail in StepLogs.all_failed_logs:
-                # Adjust status of "step" and "verify" -> failed
-                if v_step["name"].lower() == failed_step.lower():
-                    v_step["status"] = "failed"
-                    item["status"] = "failed"
+def _set(item, key, value) -> None:
+    if not isinstance(item, dict):
+        setattr(item, key, value)
+    elif value is None:
+        item.pop(key, None)
+    else:
+        item[key] = value
 
-                    # Add failed detailed message to failed verify step
-                    v_step.update(statusDetails=dict(message=msg_detail))
 
-                    if failed_attachments:
-                        # Add screenshot attachments to failed verify step
-                        v_step["attachments"] = failed_attachments[:1]
-                        del failed_attachments[:1]
+def _status_details(item, message: str):
+    return dict(message=message) if isinstance(item, dict) else StatusDetails(message=message)
 
-                    break
 
+def _step_at(steps: list, step_id: str):
+    """(step, its parent step or None) at a tree position ("2.3"), None when there is none."""
+    try:
+        indexes = [int(index) - 1 for index in step_id.split(".")]
+        if min(indexes) < 0:
+            return None
 
-def _process_broken_status(data: Dict[str, Any]) -> None:
-    """Process broken test status and update steps."""
+        parent, step = None, steps[indexes[0]]
+        if len(indexes) > 1:
+            parent, step = step, _get(step, "steps", [])[indexes[1]]
+
+    except (ValueError, IndexError):
+        return None
+
+    return step, parent
 
-    def __update_step_status(step, step_type="step", attachment=False):
-        logger.debug(StepLogs.broken_steps)
-        broken_step = next((i for i in StepLogs.broken_steps if step_type in i.lower()), None)
-        if not broken_step:
-            return
-
-        if step["name"].lower() == broken_step.lower():
-            step["status"] = "broken"
-            if attachment:
-                item["attachments"] = list(
-                    filter(lambda x: x["name"] == "broken", data.get("attachments", []))
-                )
-            StepLogs.broken_steps.remove(broken_step)
-        logger.debug(f"{StepLogs.broken_steps} after remove")
 
-    for item in data.get("steps", []):
-        __update_step_status(item, attachment=True)
+def _resolve_steps(data, records: dict) -> tuple[list, dict]:
+    """
+    Map StepLogs records (position -> (key, ...)) to the result steps: by position when the step there
+    has the recorded name, otherwise by name. Returns ([(step, parent, record)], {key: record} left to match by name).
+    """
+    steps = _get(data, "steps", [])
+    resolved, by_name = [], {}
 
-        for v_step in item.get("steps", []):
-            __update_step_status(v_step, "verify")
+    for step_id, record in records.items():
+        found = _step_at(steps, step_id)
+        if found is not None and StepLogs.key(_get(found[0], "name", "")) == record[0]:
+            resolved.append((*found, record))
+        else:
+            by_name.setdefault(record[0], record)
 
-    data["status"] = "broken"  # Adjust status test case -> broken
-    data["steps"][-1]["attachments"] = list(
-        filter(lambda x: x["name"] == "broken", data.get("attachments", []))
-    )
+    return resolved, by_name
 
 
-def _cleanup_and_customize_report(data: Dict[str, Any]) -> None:
+def _walk_by_name(data, by_name: dict):
+    """(step, parent) of the result steps whose name is left in `by_name`, in one pass."""
+    for item in _get(data, "steps", []):
+        if StepLogs.key(_get(item, "name", "")) in by_name:
+            yield item, None
+
+        for v_step in _get(item, "steps", []):
+            if StepLogs.key(_get(v_step, "name", "")) in by_name:
+                yield v_step, item
+
+
+def _process_failed_status(data, failed_steps: dict) -> None:
+    """Process failed test status and update steps."""
+    failed_attachments = [item for item in _get(data, "attachments", []) if _get(item, "name") == "screenshot"]
+    resolved, by_name = _resolve_steps(data, failed_steps)
+    if by_name:
+        resolved += [
+            (step, parent, by_name[StepLogs.key(_get(step, "name", ""))])
+            for step, parent in _walk_by_name(data, by_name) if parent is not None
+        ]
+
+    for v_step, item, (_, msg_detail) in resolved:
+        # Adjust status of "step" and "verify" -> failed
+        _set(v_step, "status", "failed")
+        if item is not None:
+            _set(item, "status", "failed")
+
+        # Add failed detailed message to failed verify step
+        _set(v_step, "statusDetails", _status_details(v_step, msg_detail))
+
+        if failed_attachments:
+            # Add screenshot attachments to failed verify step
+            _set(v_step, "attachments", failed_attachments[:1])
+            del failed_attachments[:1]
+
+
+def _process_broken_status(data, broken_steps: dict) -> None:
+    """Process broken test status and update steps."""
+    broken_attachments = [item for item in _get(data, "attachments", []) if _get(item, "name") == "broken"]
+    records = {step_id: (key,) for step_id, key in broken_steps.items()}
+    resolved, by_name = _resolve_steps(data, records)
+
+    # steps matched by name: the first one of each name only
+    for step, parent in _walk_by_name(data, by_name):
+        if by_name.pop(StepLogs.key(_get(step, "name", "")), None) is not None:
+            resolved.append((step, parent, None))
+
+    for step, parent, _ in resolved:
+        _set(step, "status", "broken")
+        if parent is None:
+            _set(step, "attachments", list(broken_attachments))
+
+    _set(data, "status", "broken")  # Adjust status test case -> broken
+    if _get(data, "steps"):
+        _set(_get(data, "steps")[-1], "attachments", list(broken_attachments))
+
+
+def _cleanup_and_customize_report(data) -> None:
     """Clean up attachments and customize report details."""
     # Clean up attachments and status details
-    if data.get("attachments"):
-        data["attachments"] = [
-            item for item in data["attachments"] if item["name"] == "Screen Recording"
-        ]
+    if _get(data, "attachments"):
+        _set(data, "attachments", [
+            item for item in _get(data, "attachments") if _get(item, "name") in KEPT_ATTACHMENTS
+        ])
 
     # Remove trace
-    data.get("statusDetails", {}).pop("trace", None)
+    if _get(data, "statusDetails"):
+        _set(_get(data, "statusDetails"), "trace", None)
 
     # Customize test case name
-    data["name"] = data["fullName"].split(".")[-1].replace("#test", "")
-    data["name"] = " ".join(data["name"].split("_"))
+    if _get(data, "fullName"):
+        name = _get(data, "fullName").split(".")[-1].replace("#test", "")
+        _set(data, "name", " ".join(name.split("_")))
 
     # Remove server, account Parameters on Allure report
-    if data.get("parameters"):
-        data["parameters"] = [
-            item for item in data["parameters"] if item["name"] not in ["server", "account"]
-        ]
+    if _get(data, "parameters"):
+        _set(data, "parameters", [
+            item for item in _get(data, "parameters") if _get(item, "name") not in ["server", "account"]
+        ])
 
 
-def _remove_zero_duration(data: Dict[str, Any]):
+def _remove_zero_duration(data) -> None:
     def __update_duration(step):
-        start = step.get("start", 0)
-        stop = step.get("stop", 0)
+        start = _get(step, "start", 0)
+        stop = _get(step, "stop", 0)
         if stop == start:
-            step["stop"] += 1
+            _set(step, "stop", stop + 1)
 
-    for item in data.get("steps", []):
+    for item in _get(data, "steps", []):
         __update_duration(item)
 
-        for v_step in item.get("steps", []):
+        for v_step in _get(item, "steps", []):
             __update_duration(v_step)
 
 
@@ -199,18 +275,23 @@ def clean_allure_log_files(allure_dir):
     """
     Check and delete all .txt log files in the allure-results directory.
     This helps keep the test results clean and prevents accumulation of log files.
+    Returns the number of deleted files.
     """
     allure_results_dir = ROOTDIR / allure_dir
-    if not os.path.exists(allure_dir):
-        return
+    if not os.path.exists(allure_results_dir):
+        return 0
 
     # Find all .txt files in allure-results directory
     log_files = glob.glob(str(allure_results_dir / '*.txt'))
-    
+    removed = 0
+
     # Delete each log file
     for log_file in log_files:
         try:
             os.remove(log_file)
+            removed += 1
 
         except Exception as e:
             logger.error(f"Error deleting log file {log_file}: {str(e)}")
+
+    return removed
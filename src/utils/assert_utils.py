@@ -20,5 +20,4 @@ def soft_assert(actual, expected, error_message=None):
         # failed_msg = failed_msg.rsplit(": ", 1)[1]
 
         # save failed verify step
-        failed_step = [item for item in StepLogs.test_steps if "verify" in item.lower()][-1]
-        StepLogs.all_failed_logs.append((failed_step, error_message))
+        StepLogs.fail(error_message)
@@ -3,6 +3,7 @@ import os.path
 import subprocess
 import time
 from src.data.consts import VIDEO_DIR
+from src.utils.xdist_utils import get_worker_id
 
 
 def compress_video(input_path, output_path):
@@ -16,9 +17,14 @@ def compress_video(input_path, output_path):
     return output_path
 
 
+def get_video_dir():
+    """Video folder of the current process, xdist workers each record into their own sub folder."""
+    return VIDEO_DIR / get_worker_id()
+
+
 def save_recorded_video(video_raw):
-    raw_path = os.path.join(VIDEO_DIR, f"test_video_{round(time.time())}_raw.mp4")
-    final_path = os.path.join(VIDEO_DIR, f"test_video_{round(time.time())}.mp4")
+    raw_path = os.path.join(get_video_dir(), f"test_video_{round(time.time())}_raw.mp4")
+    final_path = os.path.join(get_video_dir(), f"test_video_{round(time.time())}.mp4")
 
     with open(raw_path, "wb") as f:
         f.write(base64.b64decode(video_raw))
@@ -3,6 +3,7 @@ import logging
 from colorama import Fore, Style
 
 from src.data.project_info import StepLogs
+from src.utils.xdist_utils import get_worker_id
 
 logger = logging.getLogger("pythonLog")
 LOG_COLOR = {
@@ -24,8 +25,7 @@ class ColoredFormatter(logging.Formatter):
 def record_steps_log(func):
     def wrapper(*args, **kwargs):
         msg, *_ = args
-        if any(item in str(msg).lower() for item in ("step", "steps", "verify")):
-            StepLogs.test_steps.append(msg)
+        StepLogs.record(str(msg))
         return func(*args, **kwargs)
 
     return wrapper
@@ -42,6 +42,9 @@ def setup_logging(
     """
 
     log_format = '%(asctime)s | %(levelname)s | %(message)s'
+    if get_worker_id() != "master":
+        # tell parallel xdist workers apart on the console
+        log_format = f'%(asctime)s | {get_worker_id()} | %(levelname)s | %(message)s'
     date_format = "%Y-%m-%d %H:%M:%S"
 
     # Remove existing handlers to prevent duplicate logs
@@ -0,0 +1,302 @@
+import inspect
+import json
+import os
+import threading
+import time
+from functools import wraps
+
+from src.data.consts import PROFILE_DIR
+from src.utils.logging_utils import logger
+
+
+class ActionProfiler:
+    """
+    Timings of the actions run by the current test, off unless enabled.
+    One record per top level call of a public actions method: method, locator, total seconds split into
+    wait (waits for an element/condition) and command (everything else), find retries and outcome.
+    Actions called by another action are counted into their caller.
+    """
+    enabled = False
+    records = []  # current test
+    totals = {"actions": {}, "locators": {}}  # session: name -> [calls, seconds, max seconds, failures]
+    _current = None  # record of the running action
+    _wait_start = None
+
+    @classmethod
+    def configure(cls, enabled=False):
+        cls.enabled = enabled
+
+    @classmethod
+    def reset(cls):
+        """Start an empty buffer for the next test, session totals are kept."""
+        cls.records = []
+        cls._current = None
+        cls._wait_start = None
+
+    @classmethod
+    def count_retry(cls):
+        if cls._current is not None:
+            cls._current["retries"] += 1
+
+    @classmethod
+    def export(cls) -> str:
+        return json.dumps(cls.records, indent=2)
+
+    @classmethod
+    def merge(cls, totals: dict):
+        """Add the totals of another process (xdist worker) to the session totals."""
+        for group, entries in totals.items():
+            for name, (calls, seconds, longest, failures) in entries.items():
+                total = cls.totals[group].setdefault(name, [0, 0.0, 0.0, 0])
+                total[0] += calls
+                total[1] += seconds
+                total[2] = max(total[2], longest)
+                total[3] += failures
+
+    @classmethod
+    def summary(cls, top=10) -> dict:
+        """Slowest actions and locators of the session by total seconds."""
+        return {
+            group: [
+                dict(name=name, calls=calls, seconds=round(seconds, 3), max=round(longest, 3), failures=failures)
+                for name, (calls, seconds, longest, failures) in sorted(
+                    entries.items(), key=lambda item: item[1][1], reverse=True
+                )[:top]
+            ]
+            for group, entries in cls.totals.items()
+        }
+
+    @classmethod
+    def save_summary(cls, top=10) -> str:
+        """Log the slowest actions and locators and write the whole session totals next to them, return the path."""
+        summary = cls.summary(top)
+        for group, rows in summary.items():
+            logger.info(f">> Slowest {group}:")
+            for row in rows:
+                logger.info(
+                    f"   {row['seconds']:8.2f}s {row['calls']:5d} calls, max {row['max']:.2f}s, "
+                    f"{row['failures']} failed - {row['name']}"
+                )
+
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = PROFILE_DIR / "actions.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(summary=summary, totals=cls.totals), f, indent=2)
+
+        return str(path)
+
+    @classmethod
+    def _start(cls, method: str, locator: str | None) -> dict:
+        cls._current = dict(
+            method=method, locator=locator, start=time.time(),
+            duration=0.0, wait=0.0, command=0.0, retries=0, commands=0, outcome="passed"
+        )
+        return cls._current
+
+    @classmethod
+    def _finish(cls, record: dict, duration: float):
+        record["duration"] = round(duration, 4)
+        record["wait"] = round(record["wait"], 4)
+        record["command"] = round(max(duration - record["wait"], 0), 4)
+        cls._current = None
+        cls.records.append(record)
+
+        failed = record["outcome"] != "passed"
+        for group, name in (("actions", record["method"]), ("locators", record["locator"])):
+            if name is None:
+                continue
+
+            total = cls.totals[group].setdefault(name, [0, 0.0, 0.0, 0])
+            total[0] += 1
+            total[1] += duration
+            total[2] = max(total[2], duration)
+            total[3] += failed
+
+
+class CommandProfiler:
+    """
+    Driver commands (HTTP requests to the WebDriver/Appium server) of the current test and of the session,
+    off unless enabled: count, p50/p95 latency and bytes sent/received per command name.
+    The running action (see ActionProfiler) also counts the commands it issued.
+    """
+    enabled = False
+    test_samples = {}  # command -> [[seconds, ...], bytes sent, bytes received]
+    session_samples = {}
+
+    @classmethod
+    def configure(cls, enabled=False):
+        cls.enabled = enabled
+
+    @classmethod
+    def reset(cls):
+        cls.test_samples = {}
+
+    @classmethod
+    def attach(cls, driver):
+        """Profile the commands of the driver, only done while the profiler is enabled."""
+        if not cls.enabled:
+            return driver
+
+        executor = driver.command_executor
+        execute = executor.execute
+
+        @wraps(execute)
+        def profiled_execute(command, params):
+            # commands of background threads (browser prewarm) do not belong to the running test
+            if threading.current_thread() is not threading.main_thread():
+                return execute(command, params)
+
+            sent = len(json.dumps(params)) if params else 0
+            response = None
+            start = time.perf_counter()
+            try:
+                response = execute(command, params)
+                return response
+
+            finally:
+                cls._record(command, time.perf_counter() - start, sent, _payload_size(response))
+
+        executor.execute = profiled_execute
+        return driver
+
+    @classmethod
+    def export(cls) -> str:
+        return json.dumps(cls.summary(cls.test_samples), indent=2)
+
+    @classmethod
+    def merge(cls, samples: dict):
+        """Add the session samples of another process (xdist worker)."""
+        for command, (durations, sent, received) in samples.items():
+            sample = cls.session_samples.setdefault(command, [[], 0, 0])
+            sample[0].extend(durations)
+            sample[1] += sent
+            sample[2] += received
+
+    @staticmethod
+    def summary(samples: dict) -> dict:
+        """Per command, the most issued first: count, p50/p95 in milliseconds, total seconds and bytes."""
+        summary = {}
+        for command, (durations, sent, received) in sorted(samples.items(), key=lambda item: -len(item[1][0])):
+            ordered = sorted(durations)
+            summary[command] = dict(
+                count=len(ordered), p50=round(_percentile(ordered, 0.5) * 1000, 1),
+                p95=round(_percentile(ordered, 0.95) * 1000, 1), seconds=round(sum(ordered), 3),
+                sent=sent, received=received
+            )
+
+        return summary
+
+    @classmethod
+    def save_summary(cls, top=10) -> str:
+        """Log the most issued commands of the session and write the whole summary, return the path."""
+        summary = cls.summary(cls.session_samples)
+        logger.info(f">> Driver commands: {sum(row['count'] for row in summary.values())}")
+        for command, row in list(summary.items())[:top]:
+            logger.info(
+                f"   {row['count']:6d} x {command}, p50 {row['p50']}ms, p95 {row['p95']}ms, "
+                f"{row['sent']} bytes sent, {row['received']} bytes received"
+            )
+
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        path = PROFILE_DIR / "commands.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+        return str(path)
+
+    @classmethod
+    def _record(cls, command: str, seconds: float, sent: int, received: int):
+        for samples in (cls.test_samples, cls.session_samples):
+            sample = samples.setdefault(command, [[], 0, 0])
+            sample[0].append(round(seconds, 5))
+            sample[1] += sent
+            sample[2] += received
+
+        if ActionProfiler._current is not None:
+            ActionProfiler._current["commands"] += 1
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    return ordered[round(fraction * (len(ordered) - 1))] if ordered else 0.0
+
+
+def _payload_size(response) -> int:
+    """Approximate bytes of a command response (its JSON value)."""
+    if not isinstance(response, dict):
+        return 0
+
+    value = response.get("value")
+    return len(value) if isinstance(value, str) else len(json.dumps(value, default=str))
+
+
+def _describe_locator(args, kwargs) -> str | None:
+    """Readable locator(s) of an action call: a (by, value) pair, a list of them or the keys of a form."""
+    target = args[0] if args else kwargs.get("locator", kwargs.get("locators", kwargs.get("fields")))
+
+    if isinstance(target, tuple) and len(target) == 2 and all(isinstance(item, str) for item in target):
+        return f"{target[0]}={target[1]}"
+
+    if isinstance(target, (list, dict)) and target and all(isinstance(item, tuple) for item in target):
+        return " | ".join(f"{by}={value}" for by, value in target)
+
+    return None
+
+
+def _profiled_action(func):
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not ActionProfiler.enabled or ActionProfiler._current is not None:
+            return func(self, *args, **kwargs)
+
+        record = ActionProfiler._start(func.__name__, _describe_locator(args, kwargs))
+        start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+
+        except Exception as e:
+            record["outcome"] = type(e).__name__
+            raise
+
+        finally:
+            ActionProfiler._finish(record, time.perf_counter() - start)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def _profiled_wait(func):
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        record = ActionProfiler._current
+        if record is None or ActionProfiler._wait_start is not None:
+            return func(self, *args, **kwargs)
+
+        ActionProfiler._wait_start = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+
+        finally:
+            record["wait"] += time.perf_counter() - ActionProfiler._wait_start
+            ActionProfiler._wait_start = None
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+def profile_actions(cls):
+    """
+    Class decorator of the actions classes: profile their public methods (but `NOT_PROFILED`),
+    the time spent in `PROFILED_WAITS` methods counts as wait time of the running action.
+    UPPER_CASE attributes are constants even when they hold a function (DEFAULT_CONDITION), they are left as is.
+    """
+    for name, value in list(vars(cls).items()):
+        if not inspect.isfunction(value) or name.isupper() or getattr(value, "__profiled__", False):
+            continue
+
+        if name in cls.PROFILED_WAITS:
+            setattr(cls, name, _profiled_wait(value))
+
+        elif not name.startswith("_") and name not in cls.NOT_PROFILED:
+            setattr(cls, name, _profiled_action(value))
+
+    return cls
@@ -0,0 +1,102 @@
+import hashlib
+import queue
+import threading
+
+import allure
+import allure_commons
+import cv2
+import numpy as np
+from allure_commons.model2 import Attachment
+
+from src.data.consts import SCREENSHOT_MAX_WIDTH, SCREENSHOT_QUALITY, SCREENSHOT_QUEUE_SIZE
+from src.utils.allure_reporter_utils import reporter_supported, running_item
+from src.utils.logging_utils import logger
+
+
+class ScreenshotPipeline:
+    """
+    Screenshots attached to allure without holding the test back.
+    The test thread only grabs the PNG and registers the attachment on the running test (or step,
+    see `allure_reporter_utils`),
+    a worker thread downscales it, encodes it to JPEG and writes the attachment file.
+    Identical frames are written once and shared by their attachments, and captures block while
+    `SCREENSHOT_QUEUE_SIZE` screenshots are waiting (backpressure).
+    """
+    max_width = SCREENSHOT_MAX_WIDTH
+    quality = SCREENSHOT_QUALITY
+
+    _queue = queue.Queue(maxsize=SCREENSHOT_QUEUE_SIZE)
+    _worker = None
+    _seen = set()  # digests of the frames of the current test already queued or written
+
+    @classmethod
+    def reset(cls):
+        """Forget the frames of the previous test, their files stay shared only within a test."""
+        cls._seen = set()
+
+    @classmethod
+    def capture(cls, driver, name="screenshot"):
+        if not reporter_supported():
+            # allure-pytest version not checked, attach through the public API (encoded on this thread)
+            allure.attach(cls.encode(driver.get_screenshot_as_png()), name, allure.attachment_type.JPG)
+            return
+
+        item = running_item()
+        if item is None:
+            return  # allure is not reporting
+
+        png = driver.get_screenshot_as_png()
+        digest = hashlib.sha1(png).hexdigest()
+        # the attachment file is named after the frame digest, written by the worker (report_attached_data hook)
+        item.attachments.append(
+            Attachment(name=name, source=_file_name(digest), type=allure.attachment_type.JPG.mime_type)
+        )
+
+        if digest in cls._seen:
+            return
+
+        cls._seen.add(digest)
+        cls._start_worker()
+        cls._queue.put((digest, png))
+
+    @classmethod
+    def flush(cls):
+        """Wait for every queued screenshot to be written."""
+        if cls._worker is not None:
+            cls._queue.join()
+
+    @classmethod
+    def encode(cls, png: bytes) -> bytes:
+        image = cv2.imdecode(np.frombuffer(png, dtype=np.uint8), cv2.IMREAD_COLOR)
+        height, width = image.shape[:2]
+        if width > cls.max_width:
+            size = (cls.max_width, round(height * cls.max_width / width))
+            image = cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+        _, jpeg = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, cls.quality])
+        return jpeg.tobytes()
+
+    @classmethod
+    def _start_worker(cls):
+        if cls._worker is None or not cls._worker.is_alive():
+            cls._worker = threading.Thread(target=cls._run, name="screenshot-pipeline", daemon=True)
+            cls._worker.start()
+
+    @classmethod
+    def _run(cls):
+        while True:
+            digest, png = cls._queue.get()
+            try:
+                allure_commons.plugin_manager.hook.report_attached_data(
+                    body=cls.encode(png), file_name=_file_name(digest)
+                )
+
+            except Exception as e:
+                logger.error(f"Failed to write screenshot: {type(e).__name__}, {str(e)}")
+
+            finally:
+                cls._queue.task_done()
+
+
+def _file_name(digest: str) -> str:
+    return f"{digest}-attachment.{allure.attachment_type.JPG.extension}"
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+# Shared between the xdist controller and its workers through `workerinput` / `workeroutput`
+RANDOM_SEED_KEY = "random_seed"
+random_seed_key = pytest.StashKey[int]()
+
+
+def get_worker_id() -> str:
+    """Return the pytest-xdist worker id (gw0, gw1, ...) or 'master' when tests are not distributed."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def is_xdist_worker(config: pytest.Config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def is_xdist_controller(config: pytest.Config) -> bool:
+    return not is_xdist_worker(config) and getattr(config.option, "dist", "no") != "no"
+
+
+def set_worker_output(config: pytest.Config, key: str, value) -> None:
+    """Publish a JSON-serializable value from a worker, it reaches the controller in `pytest_testnodedown`."""
+    if is_xdist_worker(config):
+        config.workeroutput[key] = value
+
+
+class WorkerOutputs:
+    """Values published by every finished xdist worker, collected on the controller."""
+    outputs = {}
+
+    @classmethod
+    def collect(cls, node) -> None:
+        for key, value in getattr(node, "workeroutput", {}).items():
+            cls.outputs.setdefault(key, []).append(value)
+
+    @classmethod
+    def get(cls, key) -> list:
+        return cls.outputs.get(key, [])
@@ -9,13 +9,13 @@ from src.utils.logging_utils import logger
 
 
 @pytest.fixture
-def android_pages():
+def android_pages(request):
     """
     Fixture to initialize and provide page objects for login tests.
     Handles driver setup and cleanup.
     """
     logger.info("Initializing Android driver")
-    driver = DriverManager.get_driver(
+    driver = DriverManager.acquire_driver(
         platform=Config.config.platform
     )
     actions = MobileActions(driver)
@@ -27,4 +27,5 @@ def android_pages():
     yield PageContainer
 
     logger.info("Cleaning up Android driver")
-    DriverManager.quit_driver(Config.config.platform)
+    report = getattr(request.node, "rep_call", None)
+    DriverManager.release_driver(Config.config.platform, driver, failed=report is None or report.failed)
@@ -0,0 +1,19 @@
+import inspect
+
+from selenium.webdriver.support import expected_conditions as EC
+
+from src.core.actions.base_actions import BaseActions
+from src.core.actions.mobile_actions import MobileActions
+from src.core.actions.web_actions import WebActions
+
+
+def test():
+    # the profiler wraps methods only, the default condition must stay the EC function waits are matched against
+    assert BaseActions.DEFAULT_CONDITION is EC.visibility_of_element_located
+
+    for actions in (WebActions, MobileActions):
+        assert actions.DEFAULT_CONDITION is EC.visibility_of_element_located
+        for name in ("click", "get_text", "right_click", "press_enter"):
+            method = getattr(actions, name, None)
+            if method is not None:
+                assert inspect.signature(method).parameters["cond"].default is EC.visibility_of_element_located
@@ -9,27 +9,26 @@ from src.utils.logging_utils import logger
 
 
 @pytest.fixture
-def pages():
+def pages(request):
     """
     Fixture to initialize and provide page objects for login tests.
     Handles driver setup, page navigation, and cleanup.
+    Browsers come from a warm pool and are already parked on the login page.
     """
-    logger.info("Initializing web driver")
-    driver = DriverManager.get_driver(
+    logger.info("Acquiring web driver")
+    driver = DriverManager.acquire_driver(
         platform=Config.config.platform,
         browser=Config.config.browser,
         headless=Config.config.headless
     )
     actions = WebActions(driver)
 
-    logger.info("Navigating to login page")
-    actions.goto(Config.get_url_site())
-
     class PageContainer:
         login_page = LoginPage(actions)
         home_page = HomePage(actions)
 
     yield PageContainer
 
-    logger.info("Cleaning up web driver")
-    DriverManager.quit_driver(Config.config.platform)
+    logger.info("Releasing web driver")
+    report = getattr(request.node, "rep_call", None)
+    DriverManager.release_driver(Config.config.platform, driver, failed=report is None or report.failed)
@@ -1,5 +1,4 @@
 import random
-import time
 
 import pytest
 from src.data.object import ObjectDemoAccount
@@ -18,7 +17,7 @@ def test_missing_all_required_fields(pages):
     pages.login_page.open_demo_account_creation()
 
     logger.info(f"Step 2: Submit demo account creation form without input any field")
-    time.sleep(1)  # wait a bit for loading deposit value
+    pages.login_page.demo_account_modal.wait_for_network_idle()  # deposit values are loaded
     pages.login_page.demo_account_modal.fill_demo_account_creation_form(account_info)
     pages.login_page.demo_account_modal.click_next_button()
 
@@ -34,7 +33,7 @@ def test_invalid_email_and_phone_number_format(pages):
     pages.login_page.open_demo_account_creation()
 
     logger.info(f"Step 2: Submit demo account creation form without invalid email and phone number format")
-    time.sleep(1)  # wait a bit for loading deposit value
+    pages.login_page.demo_account_modal.wait_for_network_idle()  # deposit values are loaded
     pages.login_page.demo_account_modal.fill_demo_account_creation_form(account_info)
     pages.login_page.demo_account_modal.click_next_button()
 
@@ -52,7 +51,7 @@ def test_single_missing_field(pages, missing_field):
     pages.login_page.open_demo_account_creation()
 
     logger.info(f"Step 3: Submit demo account creation form without input field: {missing_field!r}")
-    time.sleep(1)
+    pages.login_page.demo_account_modal.wait_for_network_idle()
     pages.login_page.demo_account_modal.fill_demo_account_creation_form(account_info)
     pages.login_page.demo_account_modal.click_next_button()
 
@@ -1,6 +1,38 @@
 import pytest
 
+from src.core.actions.web_actions import WebActions
+from src.core.config_manager import Config
+from src.core.driver.driver_manager import DriverManager
+from src.page_object.web.pages.home_page import HomePage
+from src.page_object.web.pages.login_page import LoginPage
+from src.page_object.web.pages.trade_page import TradePage
+from src.utils.logging_utils import logger
 
-@pytest.fixture(scope="package")
-def pages():
-    ...
+
+@pytest.fixture
+def pages(request, server, account):
+    """
+    Fixture to initialize and provide page objects for trade tests.
+    Tests start logged in on the trade page, using the cached session when it is still valid.
+    """
+    logger.info("Acquiring web driver")
+    driver = DriverManager.acquire_driver(
+        platform=Config.config.platform,
+        browser=Config.config.browser,
+        headless=Config.config.headless
+    )
+    actions = WebActions(driver)
+
+    class PageContainer:
+        login_page = LoginPage(actions)
+        home_page = HomePage(actions)
+        trade_page = TradePage(actions)
+
+    logger.info("Logging in")
+    PageContainer.login_page.login_with_session(server, account)
+
+    yield PageContainer
+
+    logger.info("Releasing web driver")
+    report = getattr(request.node, "rep_call", None)
+    DriverManager.release_driver(Config.config.platform, driver, failed=report is None or report.failed)